@@ -5,6 +5,8 @@ from pathlib import Path
 from flask import Flask
 
 BASE_DIR = Path(__file__).resolve().parent.parent
+TEMPLATE_DIR = str(BASE_DIR / "templates")
+STATIC_DIR = str(BASE_DIR / "static")
 LOG_FORMAT = "[%(asctime)s] %(levelname)s %(name)s: %(message)s"
 LOG_LEVEL = logging.INFO
 
@@ -22,18 +24,27 @@ def create_app() -> Flask:
 
     app = Flask(
         __name__,
-        template_folder=str(BASE_DIR / "templates"),
-        static_folder=str(BASE_DIR / "static"),
+        template_folder=TEMPLATE_DIR,
+        static_folder=STATIC_DIR,
     )
 
     # Configure for production deployment
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
 
+    # POST /api/cache/clear is disabled unless a token is configured
+    app.config['CACHE_CLEAR_TOKEN'] = os.environ.get('CACHE_CLEAR_TOKEN')
+
+    # Keep NDW road work fresh off the request path (NDW_BACKGROUND_REFRESH=0 to fetch on demand)
+    app.config['NDW_BACKGROUND_REFRESH'] = os.environ.get('NDW_BACKGROUND_REFRESH', '1') != '0'
+
     # Late import to avoid circulars
-    from .routes import bp as main_bp
+    from .routes import bp as main_bp, start_roadwork_refresher
 
     app.register_blueprint(main_bp)
 
+    if app.config['NDW_BACKGROUND_REFRESH']:
+        start_roadwork_refresher()
+
     return app
 
 
@@ -1,44 +1,147 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+import heapq
+import math
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
-from .models import Chokepoint, PointOfInterest, Route, SecurityTeamPlacement
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; clustering falls back to the NumPy grid search
+    njit = None
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy (pulled in by scikit-learn) is optional; clustering falls back to the NumPy grid search
+    cKDTree = None
 
 LatLon = Tuple[float, float]
 
+_EARTH_RADIUS_M = 6371000.0
+_EARTH_DIAMETER_M = 2 * _EARTH_RADIUS_M
+
+# Above this many items a KD-tree neighbour query beats the O(N^2) compiled kernel
+_KDTREE_MIN_ITEMS = 2000
+
+# Up to this many items the NumPy fallback uses a dense pairwise distance matrix
+_DENSE_MAX_ITEMS = 256
+
+# Upper bound on elements in one chunk of a points x route-coords distance matrix
+_DISTANCE_MATRIX_MAX_ELEMENTS = 1_000_000
+
+# Base motorcade speeds (km/h) per road class
+_BASE_SPEED_KMH = {
+    "motorway": 80,
+    "trunk": 70,
+    "primary": 60,
+    "secondary": 50,
+    "tertiary": 40,
+    "residential": 20,
+    "living_street": 15
+}
+
+# Surveillance value per road class: higher capacity roads = higher priority
+_SURVEILLANCE_HIGHWAY_SCORES = {
+    "motorway": 4.0,
+    "trunk": 3.5,
+    "primary": 3.0,
+    "secondary": 2.5,
+    "tertiary": 2.0
+}
+
+# Road class groupings used by the ambush speed/isolation/density heuristics
+_RESIDENTIAL_HIGHWAYS = frozenset({"residential", "living_street"})
+_MAJOR_HIGHWAYS = frozenset({"motorway", "trunk", "primary"})
+_MID_HIGHWAYS = frozenset({"secondary", "tertiary"})
+_MEDIUM_DENSITY_HIGHWAYS = frozenset({"primary", "secondary"})
+_HIGH_DENSITY_HIGHWAYS = frozenset({"tertiary", "residential", "living_street"})
+
+# Threat-specific limits and clustering radii used by cluster_pois
+_POI_THREAT_CONFIG = {
+    'ambush_location': {'max_individual': 6, 'cluster_radius': 200},
+    'surveillance_point': {'max_individual': 8, 'cluster_radius': 300},
+    'enemy_observation_point': {'max_individual': 4, 'cluster_radius': 150},
+    'enemy_firing_point': {'max_individual': 4, 'cluster_radius': 150}
+}
+_DEFAULT_POI_THREAT_CONFIG = {'max_individual': 5, 'cluster_radius': 150}
+
+# Road classes treated as a dense or complex urban environment around a chokepoint
+_DENSE_HIGHWAYS = frozenset({"residential", "living_street", "tertiary", "secondary"})
+
+# Per-node edge context flags collected by identify_chokepoints
+_EDGE_TUNNEL = 1
+_EDGE_BRIDGE = 2
+_EDGE_DENSE = 4
+
+# Constrained road classes considered for ambush POIs, and intersecting road
+# classes considered for surveillance POIs
+_AMBUSH_HIGHWAYS = frozenset({"residential", "living_street", "tertiary"})
+_SURVEILLANCE_HIGHWAYS = frozenset({"primary", "secondary", "tertiary"})
+
+
+def _radian_coords(items: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract the (lat, lon) locations of items as two radian arrays."""
+    coords = np.radians(np.array([item["location"] for item in items], dtype=np.float64).reshape(-1, 2))
+    return coords[:, 0], coords[:, 1]
+
+
+def _haversine_to_point(lats: np.ndarray, lons: np.ndarray, lat: float, lon: float) -> np.ndarray:
+    """Vectorised haversine distance in meters from one point to many (all in radians)."""
+    a = np.sin((lats - lat) * 0.5) ** 2 + np.cos(lat) * np.cos(lats) * np.sin((lons - lon) * 0.5) ** 2
+    return _EARTH_DIAMETER_M * np.arcsin(np.sqrt(a))
+
+
+def _haversine_matrix(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Full pairwise haversine distance matrix in meters (inputs in radians)."""
+    cos_lats = np.cos(lats)
+    a = (
+        np.sin((lats[:, None] - lats[None, :]) * 0.5) ** 2
+        + cos_lats[:, None] * cos_lats[None, :] * np.sin((lons[:, None] - lons[None, :]) * 0.5) ** 2
+    )
+    return _EARTH_DIAMETER_M * np.arcsin(np.sqrt(a))
 
-def _haversine_distance(coord1: LatLon, coord2: LatLon) -> float:
-    """Calculate distance between two (lat, lon) coordinates in meters."""
-    import math
-    lat1, lon1 = coord1
-    lat2, lon2 = coord2
 
-    # Convert to radians
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+def _spatial_grid(
+    lats: np.ndarray, lons: np.ndarray, threshold_m: float
+) -> Tuple[np.ndarray, np.ndarray, Dict[Tuple[int, int], List[int]]]:
+    """Bucket radian coordinates into grid cells at least ``threshold_m`` wide.
 
-    # Haversine formula
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.asin(math.sqrt(a))
+    Two points within ``threshold_m`` of each other always land in the same or
+    adjacent cells, so a neighbour search only has to scan a 3x3 block.
+    """
+    cell_lat = max(threshold_m, 1.0) / _EARTH_RADIUS_M
+    # Widest longitude span a threshold-sized circle can cover in this dataset
+    min_cos = math.cos(float(np.abs(lats).max())) if len(lats) else 1.0
+    cell_lon = 2 * math.asin(min(1.0, math.sin(cell_lat * 0.5) / max(min_cos, 1e-12)))
 
-    # Radius of Earth in meters
-    r = 6371000
-    return c * r
+    cell_x = np.floor(lats / cell_lat).astype(np.int64)
+    cell_y = np.floor(lons / cell_lon).astype(np.int64)
 
+    grid: Dict[Tuple[int, int], List[int]] = {}
+    for idx, cell in enumerate(zip(cell_x.tolist(), cell_y.tolist())):
+        grid.setdefault(cell, []).append(idx)
 
-def _get_route_center(coords: List[LatLon]) -> LatLon:
-    """Calculate the geographic center of a route."""
-    if not coords:
-        return (0.0, 0.0)
+    return cell_x, cell_y, grid
 
-    lats = [lat for lat, lon in coords]
-    lons = [lon for lat, lon in coords]
 
-    center_lat = sum(lats) / len(lats)
-    center_lon = sum(lons) / len(lons)
+def _grid_neighbours(grid: Dict[Tuple[int, int], List[int]], cx: int, cy: int) -> np.ndarray:
+    """Sorted indices of all points in the 3x3 block of cells around (cx, cy)."""
+    candidates: List[int] = []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            candidates.extend(grid.get((cx + dx, cy + dy), ()))
+    candidates.sort()
+    return np.array(candidates, dtype=np.int64)
 
+
+def _get_route_center(path: np.ndarray) -> LatLon:
+    """Calculate the geographic center of a route given as an (N, 2) lat/lon array."""
+    if not len(path):
+        return (0.0, 0.0)
+
+    center_lat, center_lon = path.mean(axis=0).tolist()
     return (center_lat, center_lon)
 
 
@@ -48,25 +151,14 @@ def _estimate_motorcade_speed(edge: Dict, route_metadata: Dict) -> float:
     is_tunnel = edge.get("is_tunnel", False)
     is_bridge = edge.get("is_bridge", False)
 
-    # Base speeds (km/h)
-    speed_map = {
-        "motorway": 80,
-        "trunk": 70,
-        "primary": 60,
-        "secondary": 50,
-        "tertiary": 40,
-        "residential": 20,
-        "living_street": 15
-    }
-
-    base_speed = speed_map.get(highway, 30)
+    base_speed = _BASE_SPEED_KMH.get(highway, 30)
 
     # Speed penalties
     if is_tunnel:
         base_speed *= 0.7  # 30% reduction in tunnels
     if is_bridge:
         base_speed *= 0.8  # 20% reduction on bridges
-    if highway in {"residential", "living_street"}:
+    if highway in _RESIDENTIAL_HIGHWAYS:
         base_speed *= 0.6  # 40% reduction in residential areas
 
     return base_speed
@@ -77,11 +169,11 @@ def _calculate_isolation_score(edge: Dict, adjacent_edges: List[Dict]) -> float:
     highway = edge.get("highway", "")
 
     # Major roads are less isolated
-    if highway in {"motorway", "trunk", "primary"}:
+    if highway in _MAJOR_HIGHWAYS:
         return 2.0
 
     # Secondary/tertiary roads moderately isolated
-    if highway in {"secondary", "tertiary"}:
+    if highway in _MID_HIGHWAYS:
         return 4.0
 
     # Residential areas most isolated
@@ -97,51 +189,62 @@ def _estimate_urban_density(edge: Dict, surrounding_edges: List[Dict]) -> float:
         return 2.0
 
     # Primary/secondary = medium density
-    if highway in {"primary", "secondary"}:
+    if highway in _MEDIUM_DENSITY_HIGHWAYS:
         return 4.0
 
     # Tertiary/residential = high density
-    if highway in {"tertiary", "residential", "living_street"}:
+    if highway in _HIGH_DENSITY_HIGHWAYS:
         return 7.0
 
     return 5.0
 
 
-def _calculate_ambush_threat(speed: float, isolation: float, urban_density: float) -> float:
-    """Calculate ambush threat score (higher = more threatening)."""
-    # Speed factor: slower = more vulnerable (motorcade has less momentum)
-    speed_factor = max(1.0, 60.0 / speed)  # Normalize against 60 km/h for better range
+@lru_cache(maxsize=None)
+def _ambush_factors(highway: str, is_tunnel: bool, is_bridge: bool) -> Tuple[float, float, float]:
+    """Motorcade speed, isolation and urban density for a road segment.
+
+    The heuristics only look at the segment's own road class and tunnel/bridge
+    flags, so each combination is evaluated once.
+    """
+    edge = {"highway": highway, "is_tunnel": is_tunnel, "is_bridge": is_bridge}
+    return (
+        _estimate_motorcade_speed(edge, {}),
+        _calculate_isolation_score(edge, []),
+        _estimate_urban_density(edge, []),
+    )
+
 
-    # Isolation factor: more isolated = higher threat
-    isolation_factor = isolation / 2.0  # Normalize to 0-3 range
+def _ambush_threats(speeds: np.ndarray, isolations: np.ndarray, urban_densities: np.ndarray) -> np.ndarray:
+    """Ambush threat score per road segment (higher = more threatening), capped at 10."""
+    # Speed factor: slower = more vulnerable (motorcade has less momentum),
+    # normalized against 60 km/h
+    speed_factors = np.maximum(1.0, 60.0 / speeds)
+
+    # Isolation factor: more isolated = higher threat, normalized to a 0-3 range
+    isolation_factors = isolations / 2.0
 
     # Urban density factor: lower density = higher threat (fewer witnesses)
-    density_factor = max(1.0, 10.0 - urban_density)  # Inverse relationship, better range
+    density_factors = np.maximum(1.0, 10.0 - urban_densities)
+
+    threat_scores = (speed_factors * 0.5) + (isolation_factors * 0.3) + (density_factors * 0.2)
+    return np.minimum(10.0, threat_scores)
 
-    threat_score = (speed_factor * 0.5) + (isolation_factor * 0.3) + (density_factor * 0.2)
-    return min(10.0, threat_score)  # Cap at 10
 
+def _surveillance_priorities(
+    distances_from_center: np.ndarray, access_routes: np.ndarray, highway_factors: np.ndarray
+) -> np.ndarray:
+    """Surveillance priority score per candidate intersection.
 
-def _calculate_surveillance_priority(distance_from_center: float, access_routes: int, highway_type: str) -> float:
-    """Calculate surveillance priority score."""
+    ``highway_factors`` are the ``_SURVEILLANCE_HIGHWAY_SCORES`` of each
+    intersecting road (higher capacity roads = higher priority).
+    """
     # Distance factor: closer to route center = higher priority
-    distance_factor = max(1.0, 2000.0 / (distance_from_center + 200))  # Better range
-
-    # Access factor: more access routes = higher priority
-    access_factor = min(4.0, access_routes)  # Direct count, cap at 4.0
-
-    # Highway factor: higher capacity roads = higher priority
-    highway_scores = {
-        "motorway": 4.0,
-        "trunk": 3.5,
-        "primary": 3.0,
-        "secondary": 2.5,
-        "tertiary": 2.0
-    }
-    highway_factor = highway_scores.get(highway_type, 1.5)
+    distance_factors = np.maximum(1.0, 2000.0 / (distances_from_center + 200))
 
-    priority_score = (distance_factor * 0.4) + (access_factor * 0.3) + (highway_factor * 0.3)
-    return priority_score
+    # Access factor: more access routes = higher priority, capped at 4
+    access_factors = np.minimum(4.0, access_routes)
+
+    return (distance_factors * 0.4) + (access_factors * 0.3) + (highway_factors * 0.3)
 
 
 def _count_connected_roads(edge: Dict, nodes_meta: List[Dict], edge_idx: int) -> int:
@@ -160,86 +263,220 @@ def _is_elevated_position(chokepoint: Dict) -> bool:
     return chokepoint.get("type") == "intersection"
 
 
-def _min_distance_to_route(chokepoint: Dict, route_data: Dict) -> float:
-    """Calculate minimum distance from chokepoint to any route coordinate."""
-    cp_lat, cp_lon = chokepoint["location"]
-    cp_coord = (cp_lat, cp_lon)
-
-    min_distance = float('inf')
-
-    for route_payload in route_data.values():
-        coords = route_payload.get("path", [])
-        for coord in coords:
-            distance = _haversine_distance(cp_coord, coord)
-            min_distance = min(min_distance, distance)
-
-    return min_distance
-
-
-def _collect_routes(route_data: Dict[str, Dict]) -> List[Route]:
-    routes: List[Route] = []
-    for r_id, payload in route_data.items():
-        routes.append(
-            Route(
-                id=r_id,
-                label=payload["label"],
-                kind=payload["kind"],
-                path=[tuple(p) for p in payload["path"]],
-                length_m=payload["length_m"],
-                estimated_time_min=payload["estimated_time_min"],
-                turn_count=payload["turn_count"],
-                risk_score=payload["risk_score"],
-                description=payload.get("description", ""),
-            )
-        )
-    return routes
+def _route_points(prepared: Dict[str, Dict]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """All coordinates of all routes as radian lat/lon arrays plus the cosine of each latitude.
 
+    ``prepared`` is the output of ``_prepare_routes``.
+    """
+    paths = [route["path"] for route in prepared.values()]
+    points = np.radians(np.concatenate(paths) if paths else np.empty((0, 2)))
+    return points[:, 0], points[:, 1], np.cos(points[:, 0])
+
+
+def _min_haversine(lats: np.ndarray, lons: np.ndarray, cos_lats: np.ndarray, lat: float, lon: float) -> float:
+    """Smallest haversine distance in meters from one point to many (all in radians)."""
+    cos_lat = math.cos(lat)
+    min_a = math.inf
+    # Central angle of the best point so far; a point whose latitude alone is
+    # further away than that can never be closer, so it skips the trig.
+    max_dlat = math.inf
+    for k in range(lats.shape[0]):
+        dlat = lats[k] - lat
+        if abs(dlat) > max_dlat:
+            continue
+        s_lat = math.sin(dlat * 0.5)
+        s_lon = math.sin((lons[k] - lon) * 0.5)
+        a = s_lat * s_lat + cos_lat * cos_lats[k] * s_lon * s_lon
+        if a < min_a:
+            min_a = a
+            max_dlat = 2 * math.asin(math.sqrt(a)) * (1 + 1e-9)
+    if min_a == math.inf:
+        return math.inf
+    # asin and sqrt are monotonic, so only the smallest term needs them
+    return _EARTH_DIAMETER_M * math.asin(math.sqrt(min_a))
 
-def cluster_chokepoints(chokepoints: Dict[str, Dict], max_distance_m: float = 100) -> Dict[str, Dict]:
-    """Cluster nearby chokepoints to reduce clutter while maintaining security coverage."""
-    import math
 
-    def haversine_distance(coord1, coord2):
-        """Calculate distance between two (lat, lon) coordinates in meters."""
-        lat1, lon1 = coord1
-        lat2, lon2 = coord2
+_min_haversine_jit = njit(cache=True)(_min_haversine) if njit is not None else None
 
-        # Convert to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
 
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
+def _min_distances_to_route(
+    locations: List[LatLon], route_points: Tuple[np.ndarray, np.ndarray, np.ndarray]
+) -> List[float]:
+    """Calculate the minimum distance from each (lat, lon) location to any route coordinate.
 
-        # Radius of Earth in meters
-        r = 6371000
-        return c * r
+    ``route_points`` is the ``(lats, lons, cos_lats)`` triple from ``_route_points``.
+    """
+    points = np.radians(np.array(locations, dtype=np.float64).reshape(-1, 2))
+    if _min_haversine_jit is not None:
+        return [_min_haversine_jit(*route_points, lat, lon) for lat, lon in points.tolist()]
+
+    route_lats, route_lons, route_cos_lats = route_points
+    if not len(route_lats):
+        return [float('inf')] * len(points)
+
+    # One (chokepoints x route coords) matrix, built in row chunks to bound memory
+    min_a = np.empty(len(points))
+    rows = max(1, _DISTANCE_MATRIX_MAX_ELEMENTS // len(route_lats))
+    for start in range(0, len(points), rows):
+        lats = points[start:start + rows, 0:1]
+        lons = points[start:start + rows, 1:2]
+        a = (
+            np.sin((route_lats - lats) * 0.5) ** 2
+            + np.cos(lats) * route_cos_lats * np.sin((route_lons - lons) * 0.5) ** 2
+        )
+        min_a[start:start + rows] = a.min(axis=1)
+    return (_EARTH_DIAMETER_M * np.arcsin(np.sqrt(min_a))).tolist()
 
-    def find_clusters(cp_list, distance_threshold):
-        """Find clusters of nearby chokepoints."""
-        clusters = []
-        visited = set()
 
-        for i, cp in enumerate(cp_list):
-            if i in visited:
+def _cluster_labels(lats: np.ndarray, lons: np.ndarray, threshold_m: float) -> np.ndarray:
+    """Assign greedy cluster labels to radian coordinates in a single fused pass.
+
+    Written as plain scalar loops so numba can compile it; each unlabelled
+    point seeds a new cluster that absorbs every later unlabelled point within
+    ``threshold_m`` of the seed.
+    """
+    n = lats.shape[0]
+    labels = np.full(n, -1, dtype=np.int64)
+    cos_lats = np.cos(lats)
+    n_clusters = 0
+
+    # Haversine distance is never shorter than R * |dlat|, nor than
+    # R * sqrt(cos(lat1) * cos(lat2)) * 2 * sin(|dlon| / 2), which in turn is at
+    # least |dlon| * (1 - dlon**2 / 24).  Pairs failing either bound are
+    # rejected without any trig; the small margin keeps boundary pairs exact.
+    max_angle = threshold_m / _EARTH_RADIUS_M * (1 + 1e-9)
+    max_angle_sq = max_angle * max_angle
+
+    for i in range(n):
+        if labels[i] >= 0:
+            continue
+        labels[i] = n_clusters
+        for j in range(i + 1, n):
+            if labels[j] >= 0:
                 continue
+            dlat = lats[j] - lats[i]
+            if abs(dlat) > max_angle:
+                continue
+            dlon = lons[j] - lons[i]
+            dlon_sq = dlon * dlon
+            if dlon_sq < 4.0:
+                chord = 1.0 - dlon_sq / 24.0
+                if cos_lats[i] * cos_lats[j] * dlon_sq * chord * chord > max_angle_sq:
+                    continue
+            s_lat = math.sin(dlat * 0.5)
+            s_lon = math.sin(dlon * 0.5)
+            a = s_lat * s_lat + cos_lats[i] * cos_lats[j] * s_lon * s_lon
+            if _EARTH_DIAMETER_M * math.asin(math.sqrt(a)) <= threshold_m:
+                labels[j] = n_clusters
+        n_clusters += 1
+
+    return labels
+
+
+_cluster_labels_jit = njit(cache=True)(_cluster_labels) if njit is not None else None
 
-            cluster = [cp]
-            visited.add(i)
 
-            for j, other_cp in enumerate(cp_list):
-                if j not in visited:
-                    distance = haversine_distance(cp['location'], other_cp['location'])
-                    if distance <= distance_threshold:
-                        cluster.append(other_cp)
-                        visited.add(j)
+def _kdtree_labels(lats: np.ndarray, lons: np.ndarray, threshold_m: float) -> np.ndarray:
+    """Greedy cluster labels using a KD-tree over unit-sphere coordinates.
 
-            clusters.append(cluster)
+    Chord length on the unit sphere grows monotonically with great-circle
+    distance, so a slightly widened chord radius finds every candidate pair;
+    candidates are then confirmed with the exact haversine distance.
+    """
+    n = len(lats)
+    cos_lats = np.cos(lats)
+    points = np.column_stack((cos_lats * np.cos(lons), cos_lats * np.sin(lons), np.sin(lats)))
+    chord = 2 * math.sin(threshold_m / _EARTH_DIAMETER_M) * (1 + 1e-9)
+    pairs = cKDTree(points).query_pairs(chord, output_type="ndarray")
+
+    first, second = pairs[:, 0], pairs[:, 1]
+    s_lat = np.sin((lats[second] - lats[first]) * 0.5)
+    s_lon = np.sin((lons[second] - lons[first]) * 0.5)
+    a = s_lat * s_lat + cos_lats[first] * cos_lats[second] * s_lon * s_lon
+    close = _EARTH_DIAMETER_M * np.arcsin(np.sqrt(a)) <= threshold_m
+    first, second = first[close], second[close]
+
+    # Symmetric adjacency in CSR layout, neighbours sorted by index
+    rows = np.concatenate((first, second))
+    cols = np.concatenate((second, first))
+    order = np.lexsort((cols, rows))
+    cols = cols[order]
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+
+    labels = np.full(n, -1, dtype=np.int64)
+    n_clusters = 0
+    for i, (start, end) in enumerate(zip(indptr[:-1].tolist(), indptr[1:].tolist())):
+        if labels[i] >= 0:
+            continue
+        members = cols[start:end]
+        labels[members[labels[members] < 0]] = n_clusters
+        labels[i] = n_clusters
+        n_clusters += 1
+
+    return labels
+
+
+def _find_clusters(items: List[Dict], distance_threshold: float) -> List[List[Dict]]:
+    """Greedily group items whose ``location`` lies within the threshold of a seed item."""
+    if not items:
+        return []
 
+    lats, lons = _radian_coords(items)
+
+    labels = None
+    if cKDTree is not None and (len(items) >= _KDTREE_MIN_ITEMS or _cluster_labels_jit is None):
+        labels = _kdtree_labels(lats, lons, float(distance_threshold))
+    elif _cluster_labels_jit is not None:
+        labels = _cluster_labels_jit(lats, lons, float(distance_threshold))
+
+    if labels is not None:
+        grouped: List[List[Dict]] = [[] for _ in range(int(labels.max()) + 1)]
+        for item, label in zip(items, labels.tolist()):
+            grouped[label].append(item)
+        return grouped
+
+    if len(items) <= _DENSE_MAX_ITEMS:
+        # Small inputs: one broadcast distance matrix is cheaper than the grid
+        within = _haversine_matrix(lats, lons) <= distance_threshold
+        visited = np.zeros(len(items), dtype=bool)
+        clusters = []
+        for i in range(len(items)):
+            if visited[i]:
+                continue
+            members = np.flatnonzero(within[i] & ~visited)
+            visited[members] = True
+            clusters.append([items[j] for j in members])
         return clusters
 
+    cell_x, cell_y, grid = _spatial_grid(lats, lons, distance_threshold)
+    max_angle = distance_threshold / _EARTH_RADIUS_M * (1 + 1e-9)
+    clusters = []
+    # Plain bytearray for the per-seed check, viewed as a bool array for masking
+    visited_flags = bytearray(len(items))
+    visited = np.frombuffer(visited_flags, dtype=bool)
+
+    for i, cx, cy in zip(range(len(items)), cell_x.tolist(), cell_y.tolist()):
+        if visited_flags[i]:
+            continue
+
+        # Only items in the surrounding grid cells can be within range
+        candidates = _grid_neighbours(grid, cx, cy)
+        candidates = candidates[~visited[candidates]]
+        # Cheap latitude band reject before paying for the trig
+        candidates = candidates[np.abs(lats[candidates] - lats[i]) <= max_angle]
+        distances = _haversine_to_point(lats[candidates], lons[candidates], lats[i], lons[i])
+        members = candidates[distances <= distance_threshold]
+        visited[members] = True
+
+        clusters.append([items[j] for j in members])
+
+    return clusters
+
+
+def cluster_chokepoints(chokepoints: Dict[str, Dict], max_distance_m: float = 100) -> Dict[str, Dict]:
+    """Cluster nearby chokepoints to reduce clutter while maintaining security coverage."""
+
     if len(chokepoints) <= 10:
         # Keep small numbers of chokepoints as-is
         return chokepoints
@@ -248,7 +485,7 @@ def cluster_chokepoints(chokepoints: Dict[str, Dict], max_distance_m: float = 10
     cp_list = list(chokepoints.values())
 
     # Find clusters
-    clusters = find_clusters(cp_list, max_distance_m)
+    clusters = _find_clusters(cp_list, max_distance_m)
 
     # Create clustered chokepoints
     clustered_cps = {}
@@ -259,32 +496,31 @@ def cluster_chokepoints(chokepoints: Dict[str, Dict], max_distance_m: float = 10
             cp = cluster[0]
             clustered_cps[cp['id']] = cp
         else:
-            # Multiple chokepoints in cluster - merge them
-            # Use the highest-scoring chokepoint as base
-            representative = max(cluster, key=lambda cp: cp.get('vulnerability_score', 0))
-
-            # Update ID to reflect clustering
-            representative = representative.copy()
-            representative['id'] = f"{representative['id']}_cluster_{cluster_idx}"
-
-            # Combine routes affected from all chokepoints in cluster
+            # Multiple chokepoints in cluster - merge them.
+            # Combine routes and factors, and find the highest-scoring
+            # chokepoint to use as base, in a single pass
             all_routes = set()
-            for cp in cluster:
-                all_routes.update(cp.get('routes_affected', []))
-            representative['routes_affected'] = sorted(list(all_routes))
-
-            # Update vulnerability score (take the highest)
-            representative['vulnerability_score'] = max(cp.get('vulnerability_score', 0) for cp in cluster)
-
-            # Combine factors
             all_factors = set()
+            best = cluster[0]
+            max_score = best.get('vulnerability_score', 0)
             for cp in cluster:
-                all_factors.update(cp.get('factors', []))
+                all_routes.update(cp.get('routes_affected', ()))
+                all_factors.update(cp.get('factors', ()))
+                score = cp.get('vulnerability_score', 0)
+                if score > max_score:
+                    best = cp
+                    max_score = score
+
+            # Update ID to reflect clustering
+            representative = best.copy()
+            representative['id'] = f"{representative['id']}_cluster_{cluster_idx}"
+            representative['routes_affected'] = sorted(all_routes)
+            representative['vulnerability_score'] = max_score
             representative['factors'] = list(all_factors)
 
             # Update description
-            total_routes = len(set().union(*[cp.get('routes_affected', []) for cp in cluster]))
-            original_desc = representative.get('description', '').split('.')[0]  # Get first sentence
+            total_routes = len(all_routes)
+            original_desc = representative.get('description', '').partition('.')[0]  # Get first sentence
             representative['description'] = f"{original_desc}. (Merged cluster of {len(cluster)} nearby chokepoints covering {total_routes} routes)"
 
             clustered_cps[representative['id']] = representative
@@ -292,54 +528,108 @@ def cluster_chokepoints(chokepoints: Dict[str, Dict], max_distance_m: float = 10
     return clustered_cps
 
 
-def identify_chokepoints(route_data: Dict[str, Dict]) -> Dict[str, Dict]:
+def _prepare_routes(route_data: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Per-route inputs shared by ``identify_chokepoints`` and ``find_pois``.
+
+    Each route's path is converted to an (N, 2) float array once, next to the
+    raw coordinate list and the node/edge metadata lists.
+    """
+    prepared = {}
+    for route_id, payload in route_data.items():
+        coords = payload.get("path", [])
+        prepared[route_id] = {
+            "coords": coords,
+            "path": np.asarray(coords, dtype=np.float64).reshape(-1, 2),
+            "nodes": payload.get("nodes", []),
+            "nodes_meta": payload.get("nodes_meta", []),
+            "edges_meta": payload.get("edges_meta", []),
+        }
+    return prepared
+
+
+def identify_chokepoints(
+    route_data: Dict[str, Dict], prepared: Dict[str, Dict] | None = None
+) -> Dict[str, Dict]:
     """Identify chokepoints shared across routes and score their vulnerability.
 
     A chokepoint here is primarily:
     - A graph node that appears on at least two routes, or
     - A node that appears on all three routes (strong chokepoint).
+
+    ``prepared`` may pass in the result of ``_prepare_routes`` to share it with ``find_pois``.
     """
-    node_usage: Dict[int, Dict] = {}
+    if prepared is None:
+        prepared = _prepare_routes(route_data)
+
+    # Node usage is kept as parallel lists indexed through node_index
+    node_index: Dict[int, int] = {}
+    node_ids: List[int] = []
+    node_coords: List[LatLon | None] = []
+    node_routes: List[int] = []
+    node_intersection: List[bool] = []
+    node_flags: List[int] = []
+
+    def _add_node(node_id: int, coord: LatLon | None) -> int:
+        idx = node_index[node_id] = len(node_ids)
+        node_ids.append(node_id)
+        node_coords.append(coord)
+        node_routes.append(0)
+        node_intersection.append(False)
+        node_flags.append(0)
+        return idx
+
+    # Routes using a node are tracked as a bitmask, one bit per route
+    route_bits = {route_id: 1 << i for i, route_id in enumerate(route_data)}
 
     # Map nodes to routes, coordinates and edge context
-    for route_id, payload in route_data.items():
-        nodes = payload.get("nodes", [])
-        coords = payload.get("path", [])
-        nodes_meta = payload.get("nodes_meta", [])
-        edges_meta = payload.get("edges_meta", [])
+    for route_id, route in prepared.items():
+        route_bit = route_bits[route_id]
+        nodes = route["nodes"]
+        coords = route["coords"]
+        nodes_meta = route["nodes_meta"]
+        edges_meta = route["edges_meta"]
 
         for idx, (node_id, coord) in enumerate(zip(nodes, coords)):
-            info = node_usage.setdefault(
-                int(node_id),
-                {
-                    "routes": set(),
-                    "coord": tuple(coord),
-                    "is_intersection": False,
-                    "edges": [],
-                },
-            )
-            info["routes"].add(route_id)
+            node_id = int(node_id)
+            i = node_index.get(node_id)
+            if i is None:
+                i = _add_node(node_id, tuple(coord))
+            node_routes[i] |= route_bit
             if idx < len(nodes_meta) and nodes_meta[idx].get("is_intersection"):
-                info["is_intersection"] = True
+                node_intersection[i] = True
 
+        # Each edge contributes its tunnel/bridge/dense flags to both endpoints
         for edge in edges_meta:
-            u = int(edge["u"])
-            v = int(edge["v"])
-            node_usage.setdefault(u, {"routes": set(), "coord": None, "is_intersection": False, "edges": []})[
-                "edges"
-            ].append(edge)
-            node_usage.setdefault(v, {"routes": set(), "coord": None, "is_intersection": False, "edges": []})[
-                "edges"
-            ].append(edge)
+            edge_flags = 0
+            if edge.get("is_tunnel"):
+                edge_flags |= _EDGE_TUNNEL
+            if edge.get("is_bridge"):
+                edge_flags |= _EDGE_BRIDGE
+            if edge.get("highway") in _DENSE_HIGHWAYS:
+                edge_flags |= _EDGE_DENSE
+            for node_id in (int(edge["u"]), int(edge["v"])):
+                i = node_index.get(node_id)
+                if i is None:
+                    i = _add_node(node_id, None)
+                node_flags[i] |= edge_flags
 
     chokepoints: Dict[str, Dict] = {}
     total_routes = len(route_data)
+    # Few distinct route combinations exist, so decode each bitmask only once
+    sorted_routes: Dict[int, Tuple[str, ...]] = {}
 
-    for node_id, info in node_usage.items():
-        routes_here = info["routes"]
-        if not routes_here:
+    for node_id, routes_mask, is_intersection, flags, coord in zip(
+        node_ids, node_routes, node_intersection, node_flags, node_coords
+    ):
+        if not routes_mask:
             continue
 
+        routes_here = sorted_routes.get(routes_mask)
+        if routes_here is None:
+            routes_here = sorted_routes[routes_mask] = tuple(
+                sorted(route_id for route_id, bit in route_bits.items() if routes_mask & bit)
+            )
+
         shared_all = len(routes_here) == total_routes
         shared_multiple = len(routes_here) >= 2
 
@@ -357,38 +647,23 @@ def identify_chokepoints(route_data: Dict[str, Dict]) -> Dict[str, Dict]:
             score += 2.0
             factors.append("shared_by_multiple_routes")
 
-        if info.get("is_intersection"):
+        if is_intersection:
             score += 2.0
             factors.append("major_intersection")
 
-        edges = info.get("edges", [])
-        has_tunnel = any(e.get("is_tunnel") for e in edges)
-        has_bridge = any(e.get("is_bridge") for e in edges)
-        dense_env = any(
-            e.get("highway")
-            in {
-                "residential",
-                "living_street",
-                "tertiary",
-                "secondary",
-            }
-            for e in edges
-        )
-
-        if has_tunnel:
+        if flags & _EDGE_TUNNEL:
             score += 2.0
             factors.append("near_tunnel_or_underpass")
-        if has_bridge:
+        if flags & _EDGE_BRIDGE:
             score += 2.0
             factors.append("bridge_or_viaduct")
-        if dense_env:
+        if flags & _EDGE_DENSE:
             score += 1.0
             factors.append("dense_or_complex_urban_area")
 
         # Clamp the score to a 1–10 range.
         score = max(1.0, min(10.0, score))
 
-        coord = info.get("coord")
         if coord is None:
             # If for some reason we lack coordinates, skip this node.
             continue
@@ -402,16 +677,15 @@ def identify_chokepoints(route_data: Dict[str, Dict]) -> Dict[str, Dict]:
         if factors:
             description_parts.append("Factors: " + ", ".join(factors) + ".")
 
-        cp = Chokepoint(
-            id=cp_id,
-            location=(float(lat), float(lon)),
-            type="intersection",
-            routes_affected=sorted(routes_here),
-            vulnerability_score=score,
-            factors=factors,
-            description=" ".join(description_parts),
-        )
-        chokepoints[cp_id] = asdict(cp)
+        chokepoints[cp_id] = {
+            "id": cp_id,
+            "location": (float(lat), float(lon)),
+            "type": "intersection",
+            "routes_affected": list(routes_here),
+            "vulnerability_score": score,
+            "factors": factors,
+            "description": " ".join(description_parts),
+        }
 
     # Cluster nearby chokepoints to reduce clutter
     clustered_chokepoints = cluster_chokepoints(chokepoints, max_distance_m=100)
@@ -441,15 +715,7 @@ def cluster_pois(pois: Dict[str, Dict], max_distance_m: float = 150) -> Dict[str
 
         poi_list.sort(key=lambda p: p.get('priority_score', 1.0), reverse=True)
 
-        # Threat-specific limits and clustering radii
-        threat_config = {
-            'ambush_location': {'max_individual': 6, 'cluster_radius': 200},
-            'surveillance_point': {'max_individual': 8, 'cluster_radius': 300},
-            'enemy_observation_point': {'max_individual': 4, 'cluster_radius': 150},
-            'enemy_firing_point': {'max_individual': 4, 'cluster_radius': 150}
-        }
-
-        config = threat_config.get(poi_type, {'max_individual': 5, 'cluster_radius': 150})
+        config = _POI_THREAT_CONFIG.get(poi_type, _DEFAULT_POI_THREAT_CONFIG)
         max_individual = config['max_individual']
         cluster_radius = config['cluster_radius']
 
@@ -476,40 +742,17 @@ def _cluster_low_priority_pois(poi_list: List[Dict], radius_m: float) -> Dict[st
 
     clustered = {}
 
-    def find_clusters(poi_list, distance_threshold):
-        """Find clusters of nearby POIs."""
-        clusters = []
-        visited = set()
-
-        for i, poi in enumerate(poi_list):
-            if i in visited:
-                continue
-
-            cluster = [poi]
-            visited.add(i)
-
-            for j, other_poi in enumerate(poi_list):
-                if j not in visited:
-                    distance = _haversine_distance(poi['location'], other_poi['location'])
-                    if distance <= distance_threshold:
-                        cluster.append(other_poi)
-                        visited.add(j)
-
-            clusters.append(cluster)
-
-        return clusters
-
-    clusters = find_clusters(poi_list, radius_m)
+    clusters = _find_clusters(poi_list, radius_m)
 
     for cluster_idx, cluster in enumerate(clusters):
         if len(cluster) == 1:
             # Single POI, keep as-is
             clustered[cluster[0]['id']] = cluster[0]
         else:
-            # Multiple POIs in cluster - create representative POI
-            # Use highest priority POI as representative
-            representative = max(cluster, key=lambda p: p.get('priority_score', 1.0))
-            representative = representative.copy()
+            # Multiple POIs in cluster - create representative POI.
+            # poi_list arrives sorted by descending priority and clusters keep
+            # that order, so the first member is the highest priority POI.
+            representative = cluster[0].copy()
 
             # Update ID to reflect clustering
             representative['id'] = f"{representative['id']}_cluster_{cluster_idx}"
@@ -524,159 +767,196 @@ def _cluster_low_priority_pois(poi_list: List[Dict], radius_m: float) -> Dict[st
     return clustered
 
 
-def find_pois(route_data: Dict[str, Dict], chokepoints: Dict[str, Dict]) -> Dict[str, Dict]:
-    """Identify POIs for ambush, firing, observation and surveillance using tactical reasoning."""
+def _route_edge_selection(
+    edges: List[Dict], nodes_meta: List[Dict]
+) -> Tuple[List[str], Tuple[List[int], List[float], List[float]], Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """Highway per edge plus the scored ambush and surveillance candidate edges.
+
+    Ambush candidates are ``(indices, speeds, threat_scores)`` for constrained
+    segments that reach the 2.5 threat threshold. Surveillance candidates are
+    ``(indices, access_routes, highway_factors)`` for major intersections; their
+    priority also depends on the route centre and is finished in ``find_pois``.
+    """
+    n_edges = len(edges)
+    highways = [edge.get("highway", "") for edge in edges]
+    is_tunnel = np.fromiter((bool(edge.get("is_tunnel", False)) for edge in edges), dtype=bool, count=n_edges)
+    is_bridge = np.fromiter((bool(edge.get("is_bridge", False)) for edge in edges), dtype=bool, count=n_edges)
+
+    # Ambush: only constrained segments
+    constrained = np.fromiter((hw in _AMBUSH_HIGHWAYS for hw in highways), dtype=bool, count=n_edges)
+    constrained |= is_tunnel | is_bridge
+
+    # Surveillance: only major intersections, i.e. the node ending each edge
+    n_surv = max(0, min(n_edges, len(nodes_meta) - 1))
+    at_intersection = np.fromiter(
+        (bool(meta.get("is_intersection")) for meta in nodes_meta[1:n_surv + 1]), dtype=bool, count=n_surv
+    )
+    major_road = np.fromiter(
+        (hw in _SURVEILLANCE_HIGHWAYS for hw in highways[:n_surv]), dtype=bool, count=n_surv
+    )
+
+    # Score every constrained segment at once and keep the threatening ones
+    ambush_indices = np.flatnonzero(constrained)
+    factors = np.array(
+        [_ambush_factors(highways[idx], bool(is_tunnel[idx]), bool(is_bridge[idx])) for idx in ambush_indices.tolist()],
+        dtype=np.float64,
+    ).reshape(-1, 3)
+    threat_scores = _ambush_threats(factors[:, 0], factors[:, 1], factors[:, 2])
+    threatening = threat_scores >= 2.5
+    ambush = (
+        ambush_indices[threatening].tolist(),
+        factors[threatening, 0].tolist(),
+        threat_scores[threatening].tolist(),
+    )
+
+    # Roads meeting at each intersection (minus the incoming one) and road-class weight
+    surv_indices = np.flatnonzero(at_intersection & major_road)
+    access_routes = np.fromiter(
+        (_count_connected_roads(edges[idx], nodes_meta, idx) for idx in surv_indices.tolist()),
+        dtype=np.int64,
+        count=len(surv_indices),
+    )
+    highway_factors = np.fromiter(
+        (_SURVEILLANCE_HIGHWAY_SCORES.get(highways[idx], 1.5) for idx in surv_indices.tolist()),
+        dtype=np.float64,
+        count=len(surv_indices),
+    )
+
+    return highways, ambush, (surv_indices, access_routes, highway_factors)
+
+
+def find_pois(
+    route_data: Dict[str, Dict], chokepoints: Dict[str, Dict], prepared: Dict[str, Dict] | None = None
+) -> Dict[str, Dict]:
+    """Identify POIs for ambush, firing, observation and surveillance using tactical reasoning.
+
+    ``prepared`` may pass in the result of ``_prepare_routes`` to share it with ``identify_chokepoints``.
+    """
+    if prepared is None:
+        prepared = _prepare_routes(route_data)
+
     pois: Dict[str, Dict] = {}
 
     # Route-based POIs with intelligent filtering
-    for route_id, payload in route_data.items():
-        coords = payload.get("path", [])
-        edges = payload.get("edges_meta", [])
-        nodes_meta = payload.get("nodes_meta", [])
+    for route_id, route in prepared.items():
+        coords = route["coords"]
+        edges = route["edges_meta"]
+        nodes_meta = route["nodes_meta"]
 
         if not coords:
             continue
 
-        route_center = _get_route_center(coords)
+        path = route["path"]
+        route_center = _get_route_center(path)
 
         # 1) Ambush locations – Intelligent speed + context analysis
-        ambush_candidates = []
-        for idx, edge in enumerate(edges):
-            highway = edge.get("highway", "")
-            is_tunnel = edge.get("is_tunnel", False)
-            is_bridge = edge.get("is_bridge", False)
+        highways, ambush, surveillance = _route_edge_selection(edges, nodes_meta)
 
-            # Only consider constrained segments
-            if not (highway in {"residential", "living_street", "tertiary"} or is_tunnel or is_bridge):
-                continue
-
-            # Calculate tactical factors
-            speed = _estimate_motorcade_speed(edge, payload)
-
-            # Get adjacent edges for context (simplified)
-            adjacent_edges = []
-            if idx > 0:
-                adjacent_edges.append(edges[idx-1])
-            if idx < len(edges) - 1:
-                adjacent_edges.append(edges[idx+1])
-
-            isolation = _calculate_isolation_score(edge, adjacent_edges)
-            urban_density = _estimate_urban_density(edge, adjacent_edges)
-            threat_score = _calculate_ambush_threat(speed, isolation, urban_density)
-
-            # Only create POI if threat score is high enough
-            if threat_score >= 2.5:
-                coord_idx = min(idx + 1, len(coords) - 1)
-                lat, lon = coords[coord_idx]
-
-                poi_id = f"poi_ambush_{route_id}_{idx}"
-                poi = PointOfInterest(
-                    id=poi_id,
-                    type="ambush_location",
-                    location=(float(lat), float(lon)),
-                    related_route=route_id,
-                    related_chokepoint=None,
-                    description=f"High-threat ambush location (threat score: {threat_score:.1f}). Motorcade speed: {speed:.0f} km/h in {highway} segment.",
-                )
-                poi_dict = asdict(poi)
-                poi_dict['priority_score'] = threat_score
-                ambush_candidates.append(poi_dict)
+        ambush_candidates = []
+        last_coord = len(coords) - 1
+        for idx, speed, threat_score in zip(*ambush):
+            coord_idx = min(idx + 1, last_coord)
+            lat, lon = coords[coord_idx]
+
+            poi_id = f"poi_ambush_{route_id}_{idx}"
+            poi_dict = {
+                "id": poi_id,
+                "type": "ambush_location",
+                "location": (float(lat), float(lon)),
+                "related_route": route_id,
+                "related_chokepoint": None,
+                "description": f"High-threat ambush location (threat score: {threat_score:.1f}). Motorcade speed: {speed:.0f} km/h in {highways[idx]} segment.",
+                "priority_score": threat_score,
+            }
+            ambush_candidates.append(poi_dict)
 
         # Limit ambush POIs per route and add to main collection
-        ambush_candidates.sort(key=lambda p: p['priority_score'], reverse=True)
-        for poi in ambush_candidates[:8]:  # Max 8 per route
+        for poi in heapq.nlargest(8, ambush_candidates, key=lambda p: p['priority_score']):  # Max 8 per route
             pois[poi['id']] = poi
 
         # 2) Surveillance points – Distance + access filtering
+        # Distances and priorities for every candidate intersection in one go
+        surv_indices, access_routes, highway_factors = surveillance
+        surv_coord_indices = np.minimum(surv_indices + 1, last_coord)
+        surv_points = np.radians(path[surv_coord_indices])
+        center_lat, center_lon = np.radians(route_center)
+        surv_distances = _haversine_to_point(surv_points[:, 0], surv_points[:, 1], center_lat, center_lon)
+        priority_scores = _surveillance_priorities(surv_distances, access_routes, highway_factors)
+
+        # Only create high-priority surveillance points
+        keep = np.flatnonzero(priority_scores >= 2.0)
         surveillance_candidates = []
-        for idx, edge in enumerate(edges):
-            # Only consider major intersections
-            if idx + 1 >= len(nodes_meta):
-                continue
-            node_meta = nodes_meta[idx + 1]
-            if not node_meta.get("is_intersection"):
-                continue
-            highway = edge.get("highway", "")
-            if highway not in {"primary", "secondary", "tertiary"}:
-                continue
-
-            # Calculate surveillance priority
-            coord_idx = min(idx + 1, len(coords) - 1)
-            intersection_pos = coords[coord_idx]
-            distance_from_center = _haversine_distance(intersection_pos, route_center)
-            access_routes = _count_connected_roads(edge, nodes_meta, idx)
-            priority_score = _calculate_surveillance_priority(distance_from_center, access_routes, highway)
-
-            # Only create high-priority surveillance points
-            if priority_score >= 2.0:
-                lat, lon = intersection_pos
-                poi_id = f"poi_surv_{route_id}_{idx}"
-                poi = PointOfInterest(
-                    id=poi_id,
-                    type="surveillance_point",
-                    location=(float(lat), float(lon)),
-                    related_route=route_id,
-                    related_chokepoint=None,
-                    description=f"High-priority surveillance position (priority: {priority_score:.1f}). {access_routes} access routes, {distance_from_center:.0f}m from route center.",
-                )
-                poi_dict = asdict(poi)
-                poi_dict['priority_score'] = priority_score
-                surveillance_candidates.append(poi_dict)
+        for idx, coord_idx, access, distance_from_center, priority_score in zip(
+            surv_indices[keep].tolist(),
+            surv_coord_indices[keep].tolist(),
+            access_routes[keep].tolist(),
+            surv_distances[keep].tolist(),
+            priority_scores[keep].tolist(),
+        ):
+            lat, lon = coords[coord_idx]
+            poi_id = f"poi_surv_{route_id}_{idx}"
+            poi_dict = {
+                "id": poi_id,
+                "type": "surveillance_point",
+                "location": (float(lat), float(lon)),
+                "related_route": route_id,
+                "related_chokepoint": None,
+                "description": f"High-priority surveillance position (priority: {priority_score:.1f}). {access} access routes, {distance_from_center:.0f}m from route center.",
+                "priority_score": priority_score,
+            }
+            surveillance_candidates.append(poi_dict)
 
         # Limit surveillance POIs per route
-        surveillance_candidates.sort(key=lambda p: p['priority_score'], reverse=True)
-        for poi in surveillance_candidates[:10]:  # Max 10 per route
+        for poi in heapq.nlargest(10, surveillance_candidates, key=lambda p: p['priority_score']):  # Max 10 per route
             pois[poi['id']] = poi
 
     # Chokepoint-based POIs: filtered by tactical value
-    for cp_id, cp in chokepoints.items():
-        cp_score = cp.get("vulnerability_score", 0.0)
-
-        # Only create POIs for high-value chokepoints
-        if cp_score < 6.0:
-            continue
+    # Only create POIs for high-value chokepoints
+    high_value_cps = [
+        (cp_id, cp) for cp_id, cp in chokepoints.items() if cp.get("vulnerability_score", 0.0) >= 6.0
+    ]
+    route_distances = _min_distances_to_route(
+        [cp["location"] for _, cp in high_value_cps], _route_points(prepared)
+    )
 
+    for (cp_id, cp), route_distance in zip(high_value_cps, route_distances):
+        cp_score = cp.get("vulnerability_score", 0.0)
         lat, lon = cp["location"]
         has_elevation = _is_elevated_position(cp)
-        route_distance = _min_distance_to_route(cp, route_data)
 
         # Only create POIs if tactically viable
         if has_elevation or route_distance < 500:
             priority_score = cp_score / 2.0  # Normalize to reasonable priority range
 
             obs_id = f"poi_obs_{cp_id}"
-            obs_poi = PointOfInterest(
-                id=obs_id,
-                type="enemy_observation_point",
-                location=(float(lat), float(lon)),
-                related_route=None,
-                related_chokepoint=cp_id,
-                description=(
+            pois[obs_id] = {
+                "id": obs_id,
+                "type": "enemy_observation_point",
+                "location": (float(lat), float(lon)),
+                "related_route": None,
+                "related_chokepoint": cp_id,
+                "description": (
                     f"High-value observation point at chokepoint (vulnerability: {cp_score:.1f}). "
                     f"Elevation advantage: {'Yes' if has_elevation else 'Limited'}. "
                     f"Distance to route: {route_distance:.0f}m."
                 ),
-            )
-            obs_dict = asdict(obs_poi)
-            obs_dict['priority_score'] = priority_score
-            pois[obs_id] = obs_dict
+                "priority_score": priority_score,
+            }
 
             fire_id = f"poi_fire_{cp_id}"
-            fire_poi = PointOfInterest(
-                id=fire_id,
-                type="enemy_firing_point",
-                location=(float(lat), float(lon)),
-                related_route=None,
-                related_chokepoint=cp_id,
-                description=(
+            pois[fire_id] = {
+                "id": fire_id,
+                "type": "enemy_firing_point",
+                "location": (float(lat), float(lon)),
+                "related_route": None,
+                "related_chokepoint": cp_id,
+                "description": (
                     f"High-value firing position at chokepoint (vulnerability: {cp_score:.1f}). "
                     f"Elevation advantage: {'Yes' if has_elevation else 'Limited'}. "
                     f"Distance to route: {route_distance:.0f}m."
                 ),
-            )
-            fire_dict = asdict(fire_poi)
-            fire_dict['priority_score'] = priority_score
-            pois[fire_id] = fire_dict
+                "priority_score": priority_score,
+            }
 
     # Apply intelligent clustering
     clustered_pois = cluster_pois(pois)
@@ -690,13 +970,18 @@ def plan_security_assets(
     """Deploy 6 SDT teams and 3 CS teams based on chokepoint risk."""
     teams: Dict[str, Dict] = {}
 
-    # Sort chokepoints by vulnerability
-    sorted_cps = sorted(
+    # Only the six most vulnerable chokepoints are ever assigned a team
+    sorted_cps = heapq.nlargest(
+        6,
         chokepoints.values(),
         key=lambda cp: cp.get("vulnerability_score", 0.0),
-        reverse=True,
     )
 
+    # Positions of the six most vulnerable chokepoints; teams beyond the
+    # number of chokepoints fall back to the most vulnerable one.
+    top_cps = [(cp["location"], cp["id"]) for cp in sorted_cps]
+    fallback = top_cps[0] if top_cps else ((0.0, 0.0), None)
+
     # Assign SDT teams to top chokepoints where possible
     sdt_roles = [
         "Advance team: reconnaissance and early road closure at the highest-risk chokepoint.",
@@ -707,32 +992,17 @@ def plan_security_assets(
         "Quick reaction force covering alternative evacuation routes.",
     ]
 
-    for i in range(6):
+    for i, role_desc in enumerate(sdt_roles):
         team_id = f"SDT{i+1}"
-        if i < len(sorted_cps):
-            cp = sorted_cps[i]
-            lat, lon = cp["location"]
-            assigned_to = cp["id"]
-            role_desc = sdt_roles[i]
-        else:
-            # If there are fewer chokepoints than teams, fall back to a generic role.
-            any_cp = sorted_cps[0] if sorted_cps else None
-            if any_cp:
-                lat, lon = any_cp["location"]
-                assigned_to = any_cp["id"]
-            else:
-                lat, lon = (0.0, 0.0)
-                assigned_to = None
-            role_desc = sdt_roles[i]
-
-        team = SecurityTeamPlacement(
-            id=team_id,
-            type="SDT",
-            location=(float(lat), float(lon)),
-            assigned_to=assigned_to,
-            role_description=role_desc,
-        )
-        teams[team_id] = asdict(team)
+        (lat, lon), assigned_to = top_cps[i] if i < len(top_cps) else fallback
+
+        teams[team_id] = {
+            "id": team_id,
+            "type": "SDT",
+            "location": (float(lat), float(lon)),
+            "assigned_to": assigned_to,
+            "role_description": role_desc,
+        }
 
     # Assign 3 counter-sniper teams to the top three chokepoints
     cs_roles = [
@@ -741,37 +1011,26 @@ def plan_security_assets(
         "Counter-sniper team covering the reception venue and surrounding access routes.",
     ]
 
-    for i in range(3):
+    for i, role_desc in enumerate(cs_roles):
         team_id = f"CS{i+1}"
-        if i < len(sorted_cps):
-            cp = sorted_cps[i]
-            lat, lon = cp["location"]
-            assigned_to = cp["id"]
-        else:
-            any_cp = sorted_cps[0] if sorted_cps else None
-            if any_cp:
-                lat, lon = any_cp["location"]
-                assigned_to = any_cp["id"]
-            else:
-                lat, lon = (0.0, 0.0)
-                assigned_to = None
-
-        team = SecurityTeamPlacement(
-            id=team_id,
-            type="CS",
-            location=(float(lat), float(lon)),
-            assigned_to=assigned_to,
-            role_description=cs_roles[i],
-        )
-        teams[team_id] = asdict(team)
+        (lat, lon), assigned_to = top_cps[i] if i < len(top_cps) else fallback
+
+        teams[team_id] = {
+            "id": team_id,
+            "type": "CS",
+            "location": (float(lat), float(lon)),
+            "assigned_to": assigned_to,
+            "role_description": role_desc,
+        }
 
     return teams
 
 
 def full_analysis(route_data: Dict[str, Dict]) -> Dict[str, Dict]:
     """Combine routes with chokepoints, POIs and security planning."""
-    chokepoints = identify_chokepoints(route_data)
-    pois = find_pois(route_data, chokepoints)
+    prepared = _prepare_routes(route_data)
+    chokepoints = identify_chokepoints(route_data, prepared)
+    pois = find_pois(route_data, chokepoints, prepared)
     teams = plan_security_assets(chokepoints, pois)
 
     return {
@@ -11,6 +11,10 @@ RouteType = Literal["shortest", "logical", "safest"]
 
 @dataclass
 class Route:
+    __slots__ = (
+        "id", "label", "kind", "path", "length_m", "estimated_time_min", "turn_count", "risk_score", "description",
+    )
+
     id: str
     label: str
     kind: RouteType
@@ -20,50 +24,3 @@ class Route:
     turn_count: int
     risk_score: float
     description: str
-
-
-@dataclass
-class Chokepoint:
-    id: str
-    location: LatLon
-    type: str
-    routes_affected: List[str]
-    vulnerability_score: float
-    factors: List[str]
-    description: str
-
-
-@dataclass
-class PointOfInterest:
-    id: str
-    type: Literal[
-        "ambush_location",
-        "enemy_firing_point",
-        "enemy_observation_point",
-        "surveillance_point",
-    ]
-    location: LatLon
-    related_route: str | None
-    related_chokepoint: str | None
-    description: str
-
-
-@dataclass
-class SecurityTeamPlacement:
-    id: str
-    type: Literal["SDT", "CS"]
-    location: LatLon
-    assigned_to: str | None
-    role_description: str
-
-
-@dataclass
-class RoadWork:
-    id: str
-    location: LatLon
-    description: str
-    start_date: str | None
-    end_date: str | None
-    affected_roads: List[str]
-
-
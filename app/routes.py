@@ -1,27 +1,241 @@
 import logging
 import json
+import functools
+import gzip
+import hmac
+import mmap
+import os
+import pickle
+import threading
+import time
+import numpy as np
 import pandas as pd
 from pathlib import Path
 import requests
-from typing import List, Dict, Any
+from requests.adapters import HTTPAdapter
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 from datetime import datetime
 
-from flask import Blueprint, current_app, jsonify, render_template, request
+from flask import Blueprint, Response, abort, current_app, jsonify, render_template, request, send_from_directory
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional, gzip is always available
+    brotli = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - optional speed-up
+    pa = pa_csv = None
 
 from config import (
     DEFAULT_SCENARIO,
     ROTTERDAM_THE_HAGUE_SCENARIO,
     SCHIPHOL_SCENARIO,
 )
-from .models import RoadWork
 
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+EXPORTS_DIR = BASE_DIR / "exports"
+
+# NDW road work: pooled HTTP session, in-memory snapshot refreshed by a background
+# thread (or on expiry when it is not running) and an on-disk fallback
+NDW_CACHE_TTL_S = 600
+NDW_LAST_GOOD_NAME = "ndw_last_good.json"
+_NDW_SESSION = requests.Session()
+_NDW_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+_NDW_LOCK = threading.Lock()
+_NDW_WAKE = threading.Event()
+_NDW_CACHE: Dict[str, Any] = {"snapshot": None, "expires": 0.0}
+_NDW_REFRESHER: Optional[threading.Thread] = None
+
+NO_CACHE_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+# Request header carrying the token that enables POST /api/cache/clear
+CACHE_CLEAR_TOKEN_HEADER = "X-Cache-Clear-Token"
+
+# Scenario and export file prefix by scenario name; unknown names fall back to the default
+SCENARIOS = {s.name: s for s in (SCHIPHOL_SCENARIO, ROTTERDAM_THE_HAGUE_SCENARIO, DEFAULT_SCENARIO)}
+EXPORT_PREFIXES = {
+    SCHIPHOL_SCENARIO.name: "schiphol",
+    ROTTERDAM_THE_HAGUE_SCENARIO.name: "rotterdam_the_hague",
+}
+
+# Scenarios whose payload includes live NDW road work and so cannot be a static file
+LIVE_ROADWORK_SCENARIOS = frozenset({ROTTERDAM_THE_HAGUE_SCENARIO.name})
+
+# Static analysis JSON per export prefix (plus .gz/.br variants), written by
+# build_scenario_blobs.py and served by GET /api/analyze/<scenario>.json
+STATIC_ANALYSIS_NAME = "analysis_{prefix}.json"
+STATIC_ENCODING_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+# The URL is not versioned and the files change whenever they are rebuilt, so
+# caches may store them but must revalidate (cheap 304s via the ETag) each time
+STATIC_CACHE_CONTROL = "public, no-cache"
+
+# Column types of the exported CSVs (shared names across routes, chokepoints,
+# POIs and teams); columns not listed here are inferred
+CSV_COLUMN_TYPES = {
+    "id": "str",
+    "label": "str",
+    "kind": "str",
+    "type": "str",
+    "description": "str",
+    "role_description": "str",
+    "location": "str",
+    "routes_affected": "str",
+    "factors": "str",
+    "related_route": "str",
+    "related_chokepoint": "str",
+    "assigned_to": "str",
+    "lat": "float",
+    "lon": "float",
+    "length_m": "float",
+    "vulnerability_score": "float",
+    "turn_count": "int",
+}
+
+# Decimal places kept for route coordinates served to the map (~10 cm)
+COORD_DECIMALS = 6
+
+# Prebuilt analysis per export prefix, written by build_scenario_blobs.py
+SCENARIO_BLOB_NAME = "scenario_{prefix}.pkl"
+
+# Serialized /api/analyze bodies keyed by (scenario name, road work generation),
+# each holding the plain JSON ("identity") plus any compressed variants already
+# requested. The generation changes whenever the NDW road work is refreshed.
+SCENARIO_JSON: Dict[Tuple[str, int], Dict[str, bytes]] = {}
+_SCENARIO_JSON_LOCK = threading.Lock()
+
+# Content-Encodings we can pre-compress responses with, in order of preference
+RESPONSE_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def fetch_ndw_roadwork_data() -> List[Dict[str, Any]]:
+    """Road work for The Hague, cached for ``NDW_CACHE_TTL_S`` seconds.
+
+    When the NDW API is slow or down, the last successful response (kept in
+    memory and in ``exports/ndw_last_good.json``) is returned instead.
+    """
+    return _roadwork_snapshot()[1]
+
+
+def _roadwork_snapshot() -> Tuple[int, List[Dict[str, Any]]]:
+    """Current road work plus a generation number that changes on every refresh.
 
-def fetch_ndw_roadwork_data() -> List[RoadWork]:
+    While the background refresher runs, the latest snapshot is returned without
+    waiting on NDW; only the very first load blocks.
+    """
+    snapshot = _NDW_CACHE["snapshot"]
+    if snapshot is not None and _refresher_running():
+        return snapshot
+
+    with _NDW_LOCK:
+        snapshot = _NDW_CACHE["snapshot"]
+        if snapshot is not None and time.monotonic() < _NDW_CACHE["expires"]:
+            return snapshot
+        return _refresh_roadwork_locked()
+
+
+def _refresh_roadwork_locked() -> Tuple[int, List[Dict[str, Any]]]:
+    """Fetch NDW road work and publish a new snapshot. Caller holds ``_NDW_LOCK``."""
+    snapshot = _NDW_CACHE["snapshot"]
+    fetched = _request_ndw_roadwork()
+    if fetched is not None:
+        _save_last_good_roadwork(fetched)
+        # Unchanged road work keeps its generation so cached payloads stay valid
+        if snapshot is None:
+            snapshot = (1, fetched)
+        elif fetched != snapshot[1]:
+            snapshot = (snapshot[0] + 1, fetched)
+    elif snapshot is None:
+        snapshot = (1, _load_last_good_roadwork())
+    else:
+        logger.warning("Serving %d stale road work items", len(snapshot[1]))
+
+    # Failures are cached too, so an outage costs one timeout per TTL.
+    # Generation and data are published together as one tuple so lock-free
+    # readers never see a mismatched pair.
+    _NDW_CACHE["snapshot"] = snapshot
+    _NDW_CACHE["expires"] = time.monotonic() + NDW_CACHE_TTL_S
+    return snapshot
+
+
+def _refresher_running() -> bool:
+    return _NDW_REFRESHER is not None and _NDW_REFRESHER.is_alive()
+
+
+def _refresh_roadwork_loop() -> None:
+    """Refresh the road work snapshot every ``NDW_CACHE_TTL_S`` seconds, or
+    sooner when ``_NDW_WAKE`` is set."""
+    while True:
+        _NDW_WAKE.clear()
+        try:
+            with _NDW_LOCK:
+                _refresh_roadwork_locked()
+        except Exception:
+            logger.exception("Background road work refresh failed")
+        _NDW_WAKE.wait(NDW_CACHE_TTL_S)
+
+
+def start_roadwork_refresher() -> None:
+    """Start the background NDW refresher thread once per process."""
+    global _NDW_REFRESHER
+    with _NDW_LOCK:
+        if _refresher_running():
+            return
+        _NDW_REFRESHER = threading.Thread(target=_refresh_roadwork_loop, name="ndw-refresh", daemon=True)
+        _NDW_REFRESHER.start()
+    logger.info("Started background road work refresher (every %ds)", NDW_CACHE_TTL_S)
+
+
+def _save_last_good_roadwork(roadworks: List[Dict[str, Any]]) -> None:
+    """Persist a successful NDW response atomically."""
+    path = EXPORTS_DIR / NDW_LAST_GOOD_NAME
+    tmp_path = path.with_suffix(".json.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(roadworks), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not persist road work data: {e}")
+
+
+def _load_last_good_roadwork() -> List[Dict[str, Any]]:
+    """Last persisted NDW response, or an empty list when there is none."""
+    path = EXPORTS_DIR / NDW_LAST_GOOD_NAME
+    try:
+        items = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not read last good road work data: {e}")
+        return []
+
+    roadworks = [{**item, "location": tuple(item["location"])} for item in items]
+    logger.info(f"Using {len(roadworks)} road work items from last good NDW response")
+    return roadworks
+
+
+def _request_ndw_roadwork() -> Optional[List[Dict[str, Any]]]:
     """Fetch road work data from NDW API for The Hague area in January 2026.
 
     Uses the NDW API with the specific parameters provided:
     - Area: The Hague (sw=52.039725,4.237061&ne=52.097844,4.357312)
     - Period: January 2026 (01-01-2026 to 31-01-2026)
+
+    Returns None when the request fails.
     """
     try:
         # NDW API endpoint for road work data
@@ -38,174 +252,349 @@ def fetch_ndw_roadwork_data() -> List[RoadWork]:
         }
 
         logger.info("Fetching road work data from NDW API")
-        response = requests.get(base_url, params=params, timeout=30)
+        response = _NDW_SESSION.get(base_url, params=params, timeout=30)
 
         if response.status_code != 200:
             logger.warning(f"NDW API returned status {response.status_code}: {response.text}")
-            return []
+            return None
 
         data = response.json()
-        roadworks = []
 
         # Parse the response - assuming it returns features in GeoJSON-like format
-        for item in data.get("features", []):
-            try:
-                props = item.get("properties", {})
-                geometry = item.get("geometry", {})
-
-                # Extract coordinates (assuming Point geometry)
-                if geometry.get("type") == "Point":
-                    lon, lat = geometry.get("coordinates", [0, 0])
-                else:
-                    # For other geometry types, use centroid or skip
-                    continue
-
-                # Create road work object
-                roadwork = RoadWork(
-                    id=f"ndw_{props.get('id', len(roadworks))}",
-                    location=(float(lat), float(lon)),
-                    description=props.get("description", "Road work"),
-                    start_date=props.get("start_date"),
-                    end_date=props.get("end_date"),
-                    affected_roads=props.get("roads_affected", [])
-                )
-                roadworks.append(roadwork)
-
-            except Exception as e:
-                logger.warning(f"Failed to parse road work item: {e}")
-                continue
+        features = data.get("features", [])
+        roadworks = _parse_point_roadwork(features)
+        if roadworks is None:
+            roadworks = _parse_roadwork_items(features)
 
         logger.info(f"Successfully fetched {len(roadworks)} road work items from NDW API")
         return roadworks
 
     except requests.exceptions.RequestException as e:
         logger.error(f"Failed to fetch road work data from NDW API: {e}")
-        return []
+        return None
     except Exception as e:
         logger.error(f"Unexpected error fetching road work data: {e}")
-        return []
+        return None
 
 
-bp = Blueprint("main", __name__)
-logger = logging.getLogger(__name__)
+def _roadwork_record(props: Dict[str, Any], lat: float, lon: float, index: int) -> Dict[str, Any]:
+    """Road work record as served in the analysis payload's ``roadwork`` list."""
+    return {
+        "id": f"ndw_{props.get('id', index)}",
+        "location": (lat, lon),
+        "description": props.get("description", "Road work"),
+        "start_date": props.get("start_date"),
+        "end_date": props.get("end_date"),
+        "affected_roads": props.get("roads_affected", []),
+    }
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-EXPORTS_DIR = BASE_DIR / "exports"
 
+def _parse_point_roadwork(features: List[Any]) -> Optional[List[Dict[str, Any]]]:
+    """Parse all Point features in bulk: one type mask and one float64 coordinate array.
 
-def load_precomputed_analysis(scenario_name: str) -> dict:
-    """Load precomputed route analysis data instead of computing it live.
-
-    This avoids loading massive graph files into memory and is suitable for
-    memory-constrained environments like render.com.
+    Returns None when the response is irregular (non-dict items or properties,
+    ragged or non-numeric coordinates) so the caller can fall back to per-item parsing.
     """
     try:
-        # Map scenario names to export file prefixes
-        if scenario_name == SCHIPHOL_SCENARIO.name:
-            prefix = "schiphol"
-        elif scenario_name == ROTTERDAM_THE_HAGUE_SCENARIO.name:
-            prefix = "rotterdam_the_hague"
-        else:
-            prefix = "schiphol"  # default fallback
+        geometries = [item.get("geometry", {}) for item in features]
+        is_point = np.array([geometry.get("type") == "Point" for geometry in geometries], dtype=bool)
+        point_idx = np.flatnonzero(is_point).tolist()
+        if not point_idx:
+            return []
+        lon_lat = np.array(
+            [geometries[i].get("coordinates", [0, 0]) for i in point_idx], dtype=np.float64
+        ).reshape(len(point_idx), -1)
+        if lon_lat.shape[1] != 2 or not np.isfinite(lon_lat).all():
+            return None
+        props = [features[i].get("properties", {}) for i in point_idx]
+        return [
+            _roadwork_record(item_props, lat, lon, index)
+            for index, (item_props, lon, lat) in enumerate(zip(props, lon_lat[:, 0].tolist(), lon_lat[:, 1].tolist()))
+        ]
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _parse_roadwork_items(features: List[Any]) -> List[Dict[str, Any]]:
+    """Parse features one at a time, skipping (and logging) malformed items."""
+    roadworks = []
+    for item in features:
+        try:
+            props = item.get("properties", {})
+            geometry = item.get("geometry", {})
+
+            # Extract coordinates (assuming Point geometry)
+            if geometry.get("type") == "Point":
+                lon, lat = geometry.get("coordinates", [0, 0])
+            else:
+                # For other geometry types, use centroid or skip
+                continue
 
-        logger.info("Loading precomputed data for scenario=%s", scenario_name)
+            roadworks.append(_roadwork_record(props, float(lat), float(lon), len(roadworks)))
 
-        # Load routes data
-        routes_df = pd.read_csv(EXPORTS_DIR / f"routes_{prefix}.csv")
-        routes_geojson = json.loads((EXPORTS_DIR / f"routes_{prefix}.geojson").read_text())
-
-        # Convert routes to the expected format
-        routes = {}
-        for _, row in routes_df.iterrows():
-            route_id = row['id']
-            # Find corresponding GeoJSON feature
-            feature = next((f for f in routes_geojson['features'] if f['properties'].get('id') == route_id), None)
-            if feature:
-                # Convert GeoJSON coordinates [lon, lat] to [lat, lon]
-                coords = [(coord[1], coord[0]) for coord in feature['geometry']['coordinates']]
-
-                routes[route_id] = {
-                    "id": route_id,
-                    "label": row['label'],
-                    "kind": row['kind'],
-                    "path": coords,
-                    "length_m": row['length_m'],
-                    "estimated_time_min": row['length_m'] / 1000 / 50.0,  # assume 50 km/h average
-                    "turn_count": row['turn_count'],
-                    "risk_score": 2.5,  # default risk score
-                    "description": f"Precomputed {row['kind']} route",
-                    "nodes": [],  # Will be populated by analysis
-                    "nodes_meta": [],
-                    "edges_meta": []
-                }
-
-        # Load chokepoints
-        chokepoints_df = pd.read_csv(EXPORTS_DIR / f"chokepoints_{prefix}.csv")
-        chokepoints = {}
-        for _, row in chokepoints_df.iterrows():
-            # Parse location string like "(52.2726471, 4.5761073)"
-            location_str = row['location'].strip('()')
-            lat, lon = map(float, location_str.split(', '))
-
-            # Parse routes_affected string like "['r_logical', 'r_safest', 'r_shortest']"
-            routes_affected = row['routes_affected'].strip('[]').replace("'", "").split(', ')
-            routes_affected = [r.strip() for r in routes_affected]
-
-            # Parse factors string
-            factors_str = row['factors'].strip('[]').replace("'", "").split(', ')
-            factors = [f.strip() for f in factors_str if f.strip()]
-
-            chokepoints[row['id']] = {
-                "id": row['id'],
-                "location": (lat, lon),
-                "type": row['type'],
-                "routes_affected": routes_affected,
-                "vulnerability_score": row['vulnerability_score'],
-                "factors": factors,
-                "description": row['description']
-            }
+        except Exception as e:
+            logger.warning(f"Failed to parse road work item: {e}")
+            continue
+    return roadworks
 
-        # Load POIs
-        pois_df = pd.read_csv(EXPORTS_DIR / f"pois_{prefix}.csv")
-        pois = {}
-        for _, row in pois_df.iterrows():
-            # Parse location string
-            location_str = row['location'].strip('()')
-            lat, lon = map(float, location_str.split(', '))
-
-            pois[row['id']] = {
-                "id": row['id'],
-                "type": row['type'],
-                "location": (lat, lon),
-                "related_route": row['related_route'] if pd.notna(row['related_route']) else None,
-                "related_chokepoint": row['related_chokepoint'] if pd.notna(row['related_chokepoint']) else None,
-                "description": row['description']
-            }
 
-        # Load teams
-        teams_df = pd.read_csv(EXPORTS_DIR / f"teams_{prefix}.csv")
-        teams = {}
-        for _, row in teams_df.iterrows():
-            # Parse location string
-            location_str = row['location'].strip('()')
-            lat, lon = map(float, location_str.split(', '))
-
-            teams[row['id']] = {
-                "id": row['id'],
-                "type": row['type'],
-                "location": (lat, lon),
-                "assigned_to": row['assigned_to'] if pd.notna(row['assigned_to']) else None,
-                "role_description": row['role_description']
+def _read_csv(path: Path) -> pd.DataFrame:
+    """Read an exported CSV with the explicit ``CSV_COLUMN_TYPES`` schema.
+
+    Uses pyarrow's multithreaded parser when it is installed and pandas' C
+    parser otherwise; empty cells come back as missing values either way.
+    """
+    if pa_csv is not None:
+        arrow_types = {"str": pa.string(), "float": pa.float64(), "int": pa.int64()}
+        table = pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: arrow_types[kind] for name, kind in CSV_COLUMN_TYPES.items()},
+                strings_can_be_null=True,
+            ),
+        )
+        return table.to_pandas()
+
+    pandas_types = {"str": str, "float": "float64", "int": "int64"}
+    return pd.read_csv(
+        path,
+        dtype={name: pandas_types[kind] for name, kind in CSV_COLUMN_TYPES.items()},
+        # Coordinates must survive the CSV round trip bit-for-bit
+        float_precision="round_trip",
+    )
+
+
+def _csv_locations(df: pd.DataFrame) -> List[Tuple[float, float]]:
+    """(lat, lon) per row from ``lat``/``lon`` columns or a legacy ``location`` column."""
+    if "lat" in df.columns:
+        return list(zip(df["lat"].astype(float).tolist(), df["lon"].astype(float).tolist()))
+
+    # Legacy exports: location strings like "(52.2726471, 4.5761073)"
+    locations = []
+    for location in df["location"].tolist():
+        lat, lon = map(float, location.strip('()').split(', '))
+        locations.append((lat, lon))
+    return locations
+
+
+def _csv_lists(df: pd.DataFrame, column: str, keep_empty: bool = False) -> List[List[str]]:
+    """Parse a list column, JSON-encoded in current exports or a Python repr in legacy ones."""
+    values = df[column].tolist()
+    if "lat" in df.columns:
+        loads = orjson.loads if orjson is not None else json.loads
+        return [loads(value) for value in values]
+
+    # Legacy exports: strings like "['r_logical', 'r_safest', 'r_shortest']"
+    parsed = []
+    for value in values:
+        items = [item.strip() for item in value.strip('[]').replace("'", "").split(', ')]
+        parsed.append(items if keep_empty else [item for item in items if item])
+    return parsed
+
+
+def _csv_optional(df: pd.DataFrame, column: str) -> List[Any]:
+    """Column values as a list with missing cells (NaN) replaced by None."""
+    values = df[column]
+    return values.astype(object).where(values.notna(), None).tolist()
+
+
+def _load_json_file(path: Path) -> Any:
+    """Parse a JSON file straight from a read-only memory map.
+
+    Avoids decoding the whole file into a ``str`` first; orjson parses the
+    mapped bytes directly when available.
+    """
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                with memoryview(mm) as mv:
+                    return orjson.loads(mv)
+            return json.loads(mm[:])
+
+
+def _export_prefix(scenario_name: str) -> str:
+    """Map a scenario name to its export file prefix."""
+    return EXPORT_PREFIXES.get(scenario_name, "schiphol")  # default fallback
+
+
+def build_analysis_from_exports(prefix: str) -> Dict[str, Dict]:
+    """Reassemble the analysis dict from the exported CSV and GeoJSON files."""
+    # Load routes data
+    routes_df = _read_csv(EXPORTS_DIR / f"routes_{prefix}.csv")
+    routes_geojson = _load_json_file(EXPORTS_DIR / f"routes_{prefix}.geojson")
+
+    # Index GeoJSON features by route id (first feature wins, as before)
+    feature_by_id = {}
+    for f in routes_geojson['features']:
+        feature_by_id.setdefault(f['properties'].get('id'), f)
+
+    # Convert routes to the expected format
+    routes = {}
+    for route_id, label, kind, length_m, turn_count in zip(
+        routes_df['id'].tolist(),
+        routes_df['label'].tolist(),
+        routes_df['kind'].tolist(),
+        routes_df['length_m'].tolist(),
+        routes_df['turn_count'].tolist(),
+    ):
+        # Find corresponding GeoJSON feature
+        feature = feature_by_id.get(route_id)
+        if feature:
+            # Convert GeoJSON coordinates [lon, lat] to [lat, lon]
+            # and round to ~10 cm, which is all the map needs, to shrink the payload
+            lon_lat = np.round(np.asarray(feature['geometry']['coordinates'], dtype=np.float64), COORD_DECIMALS)
+            coords = lon_lat[:, 1::-1].tolist() if lon_lat.ndim == 2 else []
+
+            routes[route_id] = {
+                "id": route_id,
+                "label": label,
+                "kind": kind,
+                "path": coords,
+                "length_m": length_m,
+                "estimated_time_min": length_m / 1000 / 50.0,  # assume 50 km/h average
+                "turn_count": turn_count,
+                "risk_score": 2.5,  # default risk score
+                "description": f"Precomputed {kind} route",
+                "nodes": [],  # Will be populated by analysis
+                "nodes_meta": [],
+                "edges_meta": []
             }
 
-        # Build the analysis result
-        analysis = {
-            "routes": routes,
-            "chokepoints": chokepoints,
-            "pois": pois,
-            "teams": teams,
+    # Release the parsed GeoJSON and routes frame before parsing the other exports,
+    # so peak memory is bounded by the largest file rather than their sum
+    del feature_by_id, routes_geojson, routes_df
+
+    # Load chokepoints
+    chokepoints_df = _read_csv(EXPORTS_DIR / f"chokepoints_{prefix}.csv")
+    chokepoints = {}
+    for cp_id, location, cp_type, routes_affected, vulnerability_score, factors, description in zip(
+        chokepoints_df['id'].tolist(),
+        _csv_locations(chokepoints_df),
+        chokepoints_df['type'].tolist(),
+        _csv_lists(chokepoints_df, 'routes_affected', keep_empty=True),
+        chokepoints_df['vulnerability_score'].tolist(),
+        _csv_lists(chokepoints_df, 'factors'),
+        chokepoints_df['description'].tolist(),
+    ):
+        chokepoints[cp_id] = {
+            "id": cp_id,
+            "location": location,
+            "type": cp_type,
+            "routes_affected": routes_affected,
+            "vulnerability_score": vulnerability_score,
+            "factors": factors,
+            "description": description
+        }
+
+    del chokepoints_df
+
+    # Load POIs
+    pois_df = _read_csv(EXPORTS_DIR / f"pois_{prefix}.csv")
+    pois = {}
+    for poi_id, poi_type, location, related_route, related_chokepoint, description in zip(
+        pois_df['id'].tolist(),
+        pois_df['type'].tolist(),
+        _csv_locations(pois_df),
+        _csv_optional(pois_df, 'related_route'),
+        _csv_optional(pois_df, 'related_chokepoint'),
+        pois_df['description'].tolist(),
+    ):
+        pois[poi_id] = {
+            "id": poi_id,
+            "type": poi_type,
+            "location": location,
+            "related_route": related_route,
+            "related_chokepoint": related_chokepoint,
+            "description": description
         }
 
+    del pois_df
+
+    # Load teams
+    teams_df = _read_csv(EXPORTS_DIR / f"teams_{prefix}.csv")
+    teams = {}
+    for team_id, team_type, location, assigned_to, role_description in zip(
+        teams_df['id'].tolist(),
+        teams_df['type'].tolist(),
+        _csv_locations(teams_df),
+        _csv_optional(teams_df, 'assigned_to'),
+        teams_df['role_description'].tolist(),
+    ):
+        teams[team_id] = {
+            "id": team_id,
+            "type": team_type,
+            "location": location,
+            "assigned_to": assigned_to,
+            "role_description": role_description
+        }
+
+    # Build the analysis result
+    return {
+        "routes": routes,
+        "chokepoints": chokepoints,
+        "pois": pois,
+        "teams": teams,
+    }
+
+
+def _blob_sources(prefix: str) -> List[Path]:
+    """Export files a scenario blob is built from."""
+    return [
+        EXPORTS_DIR / f"routes_{prefix}.csv",
+        EXPORTS_DIR / f"routes_{prefix}.geojson",
+        EXPORTS_DIR / f"chokepoints_{prefix}.csv",
+        EXPORTS_DIR / f"pois_{prefix}.csv",
+        EXPORTS_DIR / f"teams_{prefix}.csv",
+    ]
+
+
+def write_scenario_blob(prefix: str) -> Path:
+    """Pickle the reassembled analysis for ``prefix`` next to the exports."""
+    path = EXPORTS_DIR / SCENARIO_BLOB_NAME.format(prefix=prefix)
+    analysis = build_analysis_from_exports(prefix)
+    with open(path, "wb") as f:
+        pickle.dump(analysis, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _load_scenario_blob(prefix: str) -> Optional[Dict[str, Dict]]:
+    """Load the prebuilt analysis blob, or None when missing or older than the exports."""
+    path = EXPORTS_DIR / SCENARIO_BLOB_NAME.format(prefix=prefix)
+    try:
+        blob_mtime = path.stat().st_mtime
+        if any(source.stat().st_mtime > blob_mtime for source in _blob_sources(prefix) if source.exists()):
+            logger.warning("Ignoring stale scenario blob %s; rebuild it with build_scenario_blobs.py", path)
+            return None
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pickle.loads(mm)
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def load_precomputed_analysis(scenario_name: str) -> Mapping[str, Dict]:
+    """Load precomputed route analysis data instead of computing it live.
+
+    This avoids loading massive graph files into memory and is suitable for
+    memory-constrained environments like render.com. A prebuilt pickle blob
+    (see ``build_scenario_blobs.py``) is used when it is newer than the
+    exports; otherwise the CSV and GeoJSON files are parsed.
+
+    Results are cached per scenario for the lifetime of the process and are
+    shared between requests, so the returned mapping is read-only; callers
+    build their own outer dict around it. Use ``/api/cache/clear`` (or
+    ``load_precomputed_analysis.cache_clear()``) after re-exporting data.
+    """
+    try:
+        prefix = _export_prefix(scenario_name)
+
+        logger.info("Loading precomputed data for scenario=%s", scenario_name)
+
+        analysis = _load_scenario_blob(prefix)
+        if analysis is None:
+            analysis = build_analysis_from_exports(prefix)
+
         logger.info(
             "Loaded precomputed analysis: routes=%d chokepoints=%d pois=%d teams=%d",
             len(analysis["routes"]),
@@ -214,13 +603,137 @@ def load_precomputed_analysis(scenario_name: str) -> dict:
             len(analysis["teams"]),
         )
 
-        return analysis
+        return MappingProxyType(analysis)
 
     except Exception as e:
         logger.exception("Failed to load precomputed analysis for scenario=%s", scenario_name)
         raise
 
 
+def _dump_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize a response payload once, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS)
+    # Compact, sorted and unescaped UTF-8 like orjson's output; float spelling
+    # can still differ (json writes NaN/Infinity where orjson writes null)
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    """Compress a serialized payload for the given Content-Encoding."""
+    if encoding == "br":
+        return brotli.compress(body, quality=11)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=9, mtime=0)
+    return body
+
+
+def _scenario_payload(scenario, encoding: str = "identity") -> bytes:
+    """Serialized (and optionally compressed) analysis for one scenario.
+
+    Each encoding is produced once per cached payload and reused afterwards.
+    """
+    # Add road work data for The Hague scenarios
+    if scenario.name in LIVE_ROADWORK_SCENARIOS:
+        generation, roadwork_data = _roadwork_snapshot()
+    else:
+        generation, roadwork_data = 0, []
+
+    key = (scenario.name, generation)
+    variants = SCENARIO_JSON.get(key)
+    if variants is None:
+        body = _dump_json(_scenario_analysis(scenario, roadwork_data))
+        with _SCENARIO_JSON_LOCK:
+            variants = SCENARIO_JSON.get(key)
+            if variants is None:
+                variants = {"identity": body}
+                # Payloads for older road work snapshots are never requested again
+                for stale in [k for k in SCENARIO_JSON if k[0] == scenario.name]:
+                    del SCENARIO_JSON[stale]
+                SCENARIO_JSON[key] = variants
+    if encoding not in variants:
+        variants[encoding] = _compress(variants["identity"], encoding)
+    return variants[encoding]
+
+
+def _scenario_analysis(scenario, roadwork_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Precomputed analysis plus scenario and roadwork fields for one scenario."""
+    # The cached analysis is shared between requests, so build a fresh outer dict
+    analysis = {
+        **load_precomputed_analysis(scenario.name),
+        "scenario": {
+            "name": scenario.name,
+            "start": scenario.start,
+            "via": scenario.via,
+            "end": scenario.end,
+        },
+        "roadwork": roadwork_data,
+    }
+    if scenario.name in LIVE_ROADWORK_SCENARIOS:
+        logger.info("Added %d road work items to analysis", len(roadwork_data))
+
+    logger.info(
+        "Analysis loaded scenario=%s routes=%d chokepoints=%d pois=%d teams=%d roadwork=%d",
+        scenario.name,
+        len(analysis["routes"]),
+        len(analysis["chokepoints"]),
+        len(analysis["pois"]),
+        len(analysis["teams"]),
+        len(analysis.get("roadwork", [])),
+    )
+    return analysis
+
+
+def write_static_analysis(scenario) -> List[Path]:
+    """Write the analysis payload for a scenario without live data as static files.
+
+    Produces the plain JSON plus pre-compressed variants next to the exports.
+    """
+    if scenario.name in LIVE_ROADWORK_SCENARIOS:
+        raise ValueError(f"Scenario {scenario.name!r} includes live road work and cannot be served statically")
+
+    path = EXPORTS_DIR / STATIC_ANALYSIS_NAME.format(prefix=_export_prefix(scenario.name))
+    body = _dump_json(_scenario_analysis(scenario, []))
+    written = [path]
+    path.write_bytes(body)
+    for encoding in RESPONSE_ENCODINGS:
+        variant = path.with_name(path.name + STATIC_ENCODING_SUFFIXES[encoding])
+        variant.write_bytes(_compress(body, encoding))
+        written.append(variant)
+    return written
+
+
+def _static_analysis_path(scenario) -> Optional[Path]:
+    """Static analysis file for a scenario, or None when missing or older than the exports."""
+    if scenario.name in LIVE_ROADWORK_SCENARIOS:
+        return None
+    prefix = _export_prefix(scenario.name)
+    path = EXPORTS_DIR / STATIC_ANALYSIS_NAME.format(prefix=prefix)
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if any(source.exists() and source.stat().st_mtime > mtime for source in _blob_sources(prefix)):
+        return None
+    return path
+
+
+def _payload_response(scenario) -> Response:
+    """Cached analysis payload for a scenario, compressed for the client."""
+    # Load precomputed data with improved POI coverage, serialized (and
+    # compressed for the client's Accept-Encoding) once per scenario
+    encoding = request.accept_encodings.best_match(RESPONSE_ENCODINGS)
+    body = _scenario_payload(scenario, encoding or "identity")
+    # Add cache control headers to prevent browser caching
+    headers = {**NO_CACHE_HEADERS, "Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(body, mimetype="application/json", headers=headers)
+
+
+bp = Blueprint("main", __name__)
+
+
 @bp.route("/")
 def index():
     """Render the main map UI."""
@@ -239,53 +752,41 @@ def health():
     return jsonify({"status": "ok"})
 
 
+@bp.route("/api/cache/clear", methods=["POST"])
+def clear_cache():
+    """Drop cached analyses and road work so the next request reloads them.
+
+    Disabled unless ``CACHE_CLEAR_TOKEN`` is configured; callers must send it
+    in the ``X-Cache-Clear-Token`` header.
+    """
+    token = current_app.config.get("CACHE_CLEAR_TOKEN")
+    if not token:
+        abort(404)
+    if not hmac.compare_digest(request.headers.get(CACHE_CLEAR_TOKEN_HEADER, ""), token):
+        abort(403)
+
+    load_precomputed_analysis.cache_clear()
+    with _SCENARIO_JSON_LOCK:
+        SCENARIO_JSON.clear()
+    # Road work is refetched by the background refresher (or on the next
+    # request when it is not running), never inline here
+    _NDW_CACHE["expires"] = 0.0
+    _NDW_WAKE.set()
+    logger.info("Cleared precomputed analysis cache")
+    return jsonify({"status": "cleared"})
+
+
 @bp.route("/api/analyze", methods=["POST"])
 def analyze():
     """Load precomputed routes and analysis for the selected scenario."""
     body = request.get_json(silent=True) or {}
     scenario_name = body.get("scenario") or DEFAULT_SCENARIO.name
 
-    if scenario_name == SCHIPHOL_SCENARIO.name:
-        scenario = SCHIPHOL_SCENARIO
-    elif scenario_name == ROTTERDAM_THE_HAGUE_SCENARIO.name:
-        scenario = ROTTERDAM_THE_HAGUE_SCENARIO
-    else:
-        scenario = DEFAULT_SCENARIO
+    scenario = SCENARIOS.get(scenario_name, DEFAULT_SCENARIO)
 
     logger.info("Loading analysis for scenario=%s", scenario.name)
     try:
-        # Load precomputed data with improved POI coverage
-        analysis = load_precomputed_analysis(scenario.name)
-        analysis["scenario"] = {
-            "name": scenario.name,
-            "start": scenario.start,
-            "via": scenario.via,
-            "end": scenario.end,
-        }
-
-        # Add road work data for The Hague scenarios
-        if scenario_name == ROTTERDAM_THE_HAGUE_SCENARIO.name:
-            roadwork_data = fetch_ndw_roadwork_data()
-            analysis["roadwork"] = [vars(rw) for rw in roadwork_data]
-            logger.info("Added %d road work items to analysis", len(roadwork_data))
-        else:
-            analysis["roadwork"] = []
-
-        logger.info(
-            "Analysis loaded scenario=%s routes=%d chokepoints=%d pois=%d teams=%d roadwork=%d",
-            scenario.name,
-            len(analysis["routes"]),
-            len(analysis["chokepoints"]),
-            len(analysis["pois"]),
-            len(analysis["teams"]),
-            len(analysis.get("roadwork", [])),
-        )
-        # Add cache control headers to prevent browser caching
-        response = jsonify(analysis)
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-        return response
+        return _payload_response(scenario)
     except Exception:
         logger.exception("Analysis failed for scenario=%s", scenario.name)
         response = jsonify({"error": "Analysis failed on the server. Check logs for details."})
@@ -293,3 +794,39 @@ def analyze():
         return response, 500
 
 
+@bp.route("/api/analyze/<scenario_name>.json")
+def analyze_static(scenario_name: str):
+    """Cacheable GET variant of /api/analyze.
+
+    Scenarios without live road work are served from the static files written
+    by build_scenario_blobs.py (with ETag/304 support), so a front web server
+    or CDN can also serve ``exports/analysis_<prefix>.json`` directly. Other
+    scenarios, or stale/missing files, fall back to the cached dynamic payload.
+    """
+    scenario = SCENARIOS.get(scenario_name)
+    if scenario is None:
+        abort(404)
+
+    path = _static_analysis_path(scenario)
+    if path is None:
+        try:
+            return _payload_response(scenario)
+        except Exception:
+            logger.exception("Analysis failed for scenario=%s", scenario.name)
+            response = jsonify({"error": "Analysis failed on the server. Check logs for details."})
+            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+            return response, 500
+
+    available = [
+        encoding for encoding in RESPONSE_ENCODINGS
+        if path.with_name(path.name + STATIC_ENCODING_SUFFIXES[encoding]).exists()
+    ]
+    encoding = request.accept_encodings.best_match(available)
+    filename = path.name + STATIC_ENCODING_SUFFIXES[encoding] if encoding else path.name
+
+    response = send_from_directory(path.parent, filename, mimetype="application/json", conditional=True)
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.headers["Vary"] = "Accept-Encoding"
+    response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
+    return response
@@ -1,19 +1,94 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+import copy
+import os
+import pickle
+import re
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
-import math
 import networkx as nx
+import numpy as np
 import osmnx as ox
-from osmnx import distance as ox_distance
+import shapely
+from osmnx import projection as ox_projection
 import logging
 
-from .models import Route
+try:
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import dijkstra
+    from scipy.spatial import cKDTree
+except ImportError:  # scipy (pulled in by scikit-learn) is optional; lookups and routing fall back to osmnx/networkx
+    csr_matrix = dijkstra = cKDTree = None
+
 
 LatLon = Tuple[float, float]
 
+# osmnx's "drive" filter (which already drops footways, cycleways, paths, steps,
+# tracks and service roads) with residential streets, living streets and
+# unclassified roads removed as well: too narrow for motorcades. Tertiary roads
+# stay and are penalised in the route weights instead.
+MOTORCADE_ROAD_FILTER = (
+    '["highway"]["area"!~"yes"]["access"!~"private"]'
+    '["highway"!~"abandoned|bridleway|bus_guideway|construction|corridor|cycleway|elevator|escalator|'
+    'footway|living_street|no|path|pedestrian|planned|platform|proposed|raceway|razed|residential|'
+    'rest_area|service|services|steps|track|unclassified"]'
+    '["motor_vehicle"!~"no"]["motorcar"!~"no"]'
+    '["service"!~"alley|driveway|emergency_access|parking|parking_aisle|private"]'
+)
+
+# Bump when the layout of G.graph["_route_index"] changes (it is pickled with the graph)
+ROUTE_INDEX_VERSION = 5
+
+# Road-class multipliers on edge length; classes not listed keep their length.
+LOGICAL_HIGHWAY_FACTORS = {
+    "motorway": 0.6,  # Strong preference for highways
+    "trunk": 0.6,
+    "primary": 0.75,  # Good preference for primary roads
+    "secondary": 0.85,  # Moderate preference for secondary roads
+    "tertiary": 0.95,  # Slight preference for tertiary roads
+    "residential": 1.3,  # Penalty for residential streets
+    "living_street": 1.3,
+    "service": 1.5,  # Strong penalty for service roads
+}
+SAFEST_HIGHWAY_FACTORS = {
+    "motorway": 0.8,  # Slight preference for controlled highways
+    "trunk": 0.8,
+    "primary": 0.9,  # Slight preference for primary roads
+    "secondary": 1.0,  # Neutral for secondary roads
+    "tertiary": 1.2,  # Slight penalty for tertiary roads
+    "residential": 2.0,  # Strong penalty for residential areas
+    "living_street": 2.0,
+    "service": 3.0,  # Heavy penalty for service roads
+}
+
+# Road segments of the manual safe route (in order) and alternative names that
+# might appear in OSM for each of them
+MANUAL_ROUTE_SEGMENTS = [
+    "A16", "N209", "A12", "Koninginnegracht", "Hubertus Viaduct",
+    "S100", "Korte Voorhout"
+]
+MANUAL_ROUTE_ALTERNATIVES = {
+    "A16": ["A16", "A 16", "rijksweg 16"],
+    "N209": ["N209", "N 209", "rijksweg 209"],
+    "A12": ["A12", "A 12", "rijksweg 12"],
+    "Koninginnegracht": ["Koninginnegracht", "Koninginne gracht", "Koningskade"],
+    "Hubertus Viaduct": ["Hubertus Viaduct", "Hubertusviaduct", "Hubertus"],
+    "S100": ["S100", "S 100", "provincialeweg 100"],
+    "Korte Voorhout": ["Korte Voorhout", "Kortevoorhout"]
+}
+# Matched against lower-cased names, so these are plain substring searches
+_SEGMENT_PATTERNS = {
+    segment: re.compile("|".join(re.escape(name.lower()) for name in names))
+    for segment, names in MANUAL_ROUTE_ALTERNATIVES.items()
+}
+_ANY_SEGMENT_PATTERN = re.compile("|".join(pattern.pattern for pattern in _SEGMENT_PATTERNS.values()))
+
+TUNNEL_VALUES = frozenset({"yes", "building_passage"})
+BRIDGE_VALUES = frozenset({"yes", "viaduct"})
+
 # Configure OSMnx caching so we don't keep refetching the same tiles.
 BASE_DIR = Path(__file__).resolve().parent.parent
 CACHE_DIR = BASE_DIR / "cache"
@@ -26,131 +101,210 @@ ox.settings.log_console = False
 # Priority order: precomputed (repo-included) -> cache (runtime) -> download (fallback)
 logger = logging.getLogger(__name__)
 
+# Road graphs already loaded in this process, keyed by GraphML path. Shared by
+# every compute_routes call (and by forked workers when loaded before forking).
+_GRAPHS: Dict[Path, nx.MultiDiGraph] = {}
+_GRAPHS_LOCK = threading.Lock()
+
 
 def build_graph(center: LatLon, dist_m: int = 20000, scenario_name: str = "default") -> nx.MultiDiGraph:
     """Download and build a drivable road network around the given center.
 
     The graph is cached by osmnx internally so repeated calls are cheap when
-    the user runs the app multiple times.
+    the user runs the app multiple times. Loaded graphs are also kept in memory
+    for the life of the process; callers share them and must not modify them.
     """
 
     # Priority 1: Unified graph (covers everything - new approach)
     UNIFIED_GRAPH_FILE = BASE_DIR / "precomputed" / "unified_graph.graphml"
     if UNIFIED_GRAPH_FILE.exists():
         logger.info("Loading unified road network from %s", UNIFIED_GRAPH_FILE)
-        return ox.load_graphml(UNIFIED_GRAPH_FILE)
+        return _load_graph(UNIFIED_GRAPH_FILE)
 
     # Priority 2: Scenario-specific precomputed graphs (fallback)
     PRECOMPUTED_GRAPH_FILE = BASE_DIR / "precomputed" / f"{scenario_name}_graph.graphml"
     if PRECOMPUTED_GRAPH_FILE.exists():
         logger.info("Loading scenario-specific graph from %s", PRECOMPUTED_GRAPH_FILE)
-        return ox.load_graphml(PRECOMPUTED_GRAPH_FILE)
+        return _load_graph(PRECOMPUTED_GRAPH_FILE)
 
     # Priority 3: Runtime cache
     GRAPH_CACHE_FILE = CACHE_DIR / f"{scenario_name}_graph.graphml"
     if GRAPH_CACHE_FILE.exists():
         logger.info("Loading cached road network from %s", GRAPH_CACHE_FILE)
-        return ox.load_graphml(GRAPH_CACHE_FILE)
+        return _load_graph(GRAPH_CACHE_FILE)
 
     logger.info("Downloading road network from OSM (dist=%sm)", dist_m)
-    # Get the full road network with high resolution geometries
-    G = ox.graph_from_point(center, dist=dist_m, network_type="drive", simplify=False)
-    G = ox_distance.add_edge_lengths(G)
-
-    # Filter out roads that are unsuitable for motorcades
-    # Remove pedestrian-only ways, cycleways, and minor roads to force major road usage
-    edges_to_remove = []
-    for u, v, k, data in G.edges(keys=True, data=True):
-        highway = _normalize_highway(data.get("highway", ""))
-        # Remove paths that aren't suitable for motorcade routes
-        if highway in {"footway", "pedestrian", "cycleway", "path", "steps", "track"}:
-            edges_to_remove.append((u, v, k))
-        # Remove residential streets and living streets (too narrow for motorcades)
-        elif highway in {"residential", "living_street", "unclassified"}:
-            edges_to_remove.append((u, v, k))
-        # Remove service roads that are likely to be narrow alleys
-        elif highway == "service":
-            edges_to_remove.append((u, v, k))
-        # Remove tertiary roads unless they're important connectors
-        elif highway == "tertiary":
-            # Keep some tertiary roads that connect major routes, but penalize them heavily
-            pass  # We'll handle tertiary roads in the weighting instead
-
-    for u, v, k in edges_to_remove:
-        if G.has_edge(u, v, k):
-            G.remove_edge(u, v, k)
-
-    # Remove isolated nodes (nodes with no edges)
-    isolated_nodes = [node for node in G.nodes() if G.degree(node) == 0]
-    G.remove_nodes_from(isolated_nodes)
+    # Overpass only returns roads suitable for motorcades, so the graph can be
+    # simplified (degree-2 chains contracted, geometry kept) as it is built.
+    G = ox.graph_from_point(center, dist=dist_m, custom_filter=MOTORCADE_ROAD_FILTER, simplify=True)
 
     ox.save_graphml(G, GRAPH_CACHE_FILE)
+    with _GRAPHS_LOCK:
+        _GRAPHS[GRAPH_CACHE_FILE] = G
     logger.info("Road network downloaded, filtered and cached (%d nodes, %d edges)",
                 len(G.nodes), len(G.edges))
     return G
 
 
+def _load_graph(graphml_file: Path) -> nx.MultiDiGraph:
+    """Return the process-wide road graph for ``graphml_file``, loading it on first use."""
+    with _GRAPHS_LOCK:
+        G = _GRAPHS.get(graphml_file)
+        if G is None:
+            G = _read_graph(graphml_file)
+            _GRAPHS[graphml_file] = G
+    return G
+
+
+def _read_graph(graphml_file: Path) -> nx.MultiDiGraph:
+    """Read a GraphML road network through a binary pickle kept in the cache dir.
+
+    Parsing GraphML dominates start-up, so the first load pickles the graph
+    together with its nearest-node tree and routing index; later loads read
+    the pickle until the GraphML file is modified again.
+    """
+    pickle_file = CACHE_DIR / f"{graphml_file.parent.name}_{graphml_file.stem}.pkl"
+    try:
+        if pickle_file.stat().st_mtime >= graphml_file.stat().st_mtime:
+            with open(pickle_file, "rb") as f:
+                return pickle.load(f)
+        logger.info("Graph pickle %s is older than %s; rebuilding", pickle_file, graphml_file)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.warning("Ignoring unreadable graph pickle %s", pickle_file, exc_info=True)
+
+    G = ox.load_graphml(graphml_file)
+    if cKDTree is not None:
+        _node_tree(G)
+    _route_index(G)
+    try:
+        tmp_file = pickle_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump(G, f, protocol=5)
+        os.replace(tmp_file, pickle_file)
+    except OSError:
+        logger.warning("Could not write graph pickle %s", pickle_file, exc_info=True)
+    return G
+
+
+def _node_tree(G: nx.MultiDiGraph) -> Tuple[Any, np.ndarray, bool]:
+    """KD-tree over the graph's node coordinates, built once and cached on ``G.graph``.
+
+    Unprojected graphs are indexed as points on the unit sphere so the chord
+    distance ranks neighbours exactly like the haversine metric osmnx uses.
+    """
+    cached = G.graph.get("_node_tree")
+    if cached is None:
+        node_ids = np.array(list(G.nodes))
+        xs = np.fromiter((d["x"] for _, d in G.nodes(data=True)), dtype=float, count=len(node_ids))
+        ys = np.fromiter((d["y"] for _, d in G.nodes(data=True)), dtype=float, count=len(node_ids))
+        projected = ox_projection.is_projected(G.graph.get("crs"))
+        points = np.column_stack((xs, ys)) if projected else _unit_vectors(ys, xs)
+        cached = (cKDTree(points), node_ids, projected)
+        G.graph["_node_tree"] = cached
+    return cached
+
+
+def _unit_vectors(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    lat_r = np.radians(lats)
+    lon_r = np.radians(lons)
+    cos_lat = np.cos(lat_r)
+    return np.column_stack((cos_lat * np.cos(lon_r), cos_lat * np.sin(lon_r), np.sin(lat_r)))
+
+
+def _nodes_for_points(G: nx.MultiDiGraph, points: List[LatLon]) -> List[int]:
+    """Find the nearest graph node for each (lat, lon) point in one query."""
+    lats = np.array([p[0] for p in points], dtype=float)
+    lons = np.array([p[1] for p in points], dtype=float)
+    if cKDTree is None:
+        return [int(n) for n in ox.nearest_nodes(G, lons, lats)]
+    tree, node_ids, projected = _node_tree(G)
+    _, idx = tree.query(np.column_stack((lons, lats)) if projected else _unit_vectors(lats, lons))
+    return [int(n) for n in node_ids[idx]]
+
+
 def _node_for_point(G: nx.MultiDiGraph, point: LatLon) -> int:
     """Find the nearest graph node for a given (lat, lon) point."""
-    lat, lon = point
-    return ox.nearest_nodes(G, lon, lat)
+    return _nodes_for_points(G, [point])[0]
 
 
-def _path_length(G: nx.MultiDiGraph, path: List[int]) -> float:
+def _walk_path(G: nx.MultiDiGraph, path: List[int]) -> Tuple[List[Dict], List[float], List[str], List[bool], List[bool]]:
+    """Resolve every edge along a path from the route index.
+
+    Each consecutive node pair maps to its edge position once; the shortest
+    parallel edge's attribute dict, length, highway class and tunnel/bridge
+    flags are then gathered by position.
+    """
+    index = _route_index(G)
+    pairs = index["pairs"]
+    positions = [pairs[(u, v)] for u, v in zip(path, path[1:])]
+    edge_attrs = index["edge_attrs"]
+    highway = index["highway"]
+    edges = [edge_attrs[p] for p in positions]
+    lengths = index["edge_length"][positions].tolist()
+    highways = [highway[p] for p in positions]
+    tunnels = index["tunnel"][positions].tolist()
+    bridges = index["bridge"][positions].tolist()
+    return edges, lengths, highways, tunnels, bridges
+
+
+def _path_length(lengths: List[float]) -> float:
     """Compute the total length of a path in meters."""
     length = 0.0
-    for u, v in zip(path[:-1], path[1:]):
-        data = min(G.get_edge_data(u, v).values(), key=lambda d: d.get("length", 0))
-        length += float(data.get("length", 0.0))
+    for edge_length in lengths:
+        length += edge_length
     return length
 
 
-def _path_to_coords(G: nx.MultiDiGraph, path: List[int]) -> List[LatLon]:
-    """Extract coordinates that perfectly follow road geometries, not just node points."""
-    coords = []
+def _path_to_coords(G: nx.MultiDiGraph, path: List[int], edges: List[Dict]) -> List[LatLon]:
+    """Extract coordinates that perfectly follow road geometries, not just node points.
 
-    for i in range(len(path) - 1):
-        u, v = path[i], path[i + 1]
-
-        # Get edge data (handle MultiDiGraph)
-        edge_data = G.get_edge_data(u, v)
-        if not edge_data:
-            continue
-
-        # Get the edge with the shortest length (or any if no length data)
-        edge = min(edge_data.values(), key=lambda d: d.get("length", 0))
-
-        # Check if edge has geometry data
-        if "geometry" in edge and edge["geometry"] is not None:
-            # Use the full road geometry
-            geometry = edge["geometry"]
-            # Convert shapely LineString to coordinate list
-            edge_coords = list(geometry.coords)
-            # Convert to (lat, lon) tuples
-            edge_coords = [(float(coord[1]), float(coord[0])) for coord in edge_coords]
-
-            # Add coordinates, but avoid duplicating the connection point
-            if coords:
-                # Skip the first coordinate if it matches the last one added
-                start_idx = 1 if edge_coords and coords[-1] == edge_coords[0] else 0
-                coords.extend(edge_coords[start_idx:])
-            else:
-                coords.extend(edge_coords)
+    All edge geometries are unpacked with a single ``shapely.get_coordinates``
+    call. Edges without geometry contribute their start node (and the final
+    node on the last edge). The first point of each edge is dropped when it
+    repeats the previous point, so connection points are not duplicated.
+    """
+    if not edges:
+        return []
+    nodes = G._node  # private NetworkX node-attribute dict, see _route_index
+    geoms = [edge.get("geometry") for edge in edges]
+    present = [g for g in geoms if g is not None]
+    xy, owner = shapely.get_coordinates(present, return_index=True)
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(owner, minlength=len(present)))))
+
+    blocks: List[np.ndarray] = []
+    g = 0
+    last = len(edges) - 1
+    for i, geometry in enumerate(geoms):
+        if geometry is not None:
+            blocks.append(xy[offsets[g]:offsets[g + 1]])
+            g += 1
         else:
             # Fallback: use node coordinates if no geometry available
-            if not coords or coords[-1] != (float(G.nodes[u]["y"]), float(G.nodes[u]["x"])):
-                coords.append((float(G.nodes[u]["y"]), float(G.nodes[u]["x"])))
-            if i == len(path) - 2:  # Last edge
-                coords.append((float(G.nodes[v]["y"]), float(G.nodes[v]["x"])))
-
-    return coords
-
-
-def _nodes_metadata(G: nx.MultiDiGraph, path: List[int]) -> List[Dict]:
+            u = nodes[path[i]]
+            block = [(float(u["x"]), float(u["y"]))]
+            if i == last:
+                v = nodes[path[i + 1]]
+                block.append((float(v["x"]), float(v["y"])))
+            blocks.append(np.array(block, dtype=float))
+
+    starts = np.cumsum([0] + [len(block) for block in blocks[:-1]])
+    points = np.concatenate(blocks)
+    if not len(points):
+        return []
+    starts = starts[(starts > 0) & (starts < len(points))]
+    keep = np.ones(len(points), dtype=bool)
+    keep[starts] = (points[starts] != points[starts - 1]).any(axis=1)
+    points = points[keep]
+    return list(zip(points[:, 1].tolist(), points[:, 0].tolist()))
+
+
+def _nodes_metadata(degrees: Dict[int, int], path: List[int]) -> List[Dict]:
     """Light-weight per-node metadata used later for chokepoint analysis."""
     meta: List[Dict] = []
     for n in path:
-        degree = int(G.degree[n])
+        degree = int(degrees[n])
         meta.append(
             {
                 "id": int(n),
@@ -161,40 +315,45 @@ def _nodes_metadata(G: nx.MultiDiGraph, path: List[int]) -> List[Dict]:
     return meta
 
 
-def _edges_metadata(G: nx.MultiDiGraph, path: List[int]) -> List[Dict]:
+def _edges_metadata(
+    path: List[int],
+    lengths: List[float],
+    highways: List[str],
+    tunnels: List[bool],
+    bridges: List[bool],
+) -> List[Dict]:
     """Light-weight per-edge metadata for risk heuristics."""
-    meta: List[Dict] = []
-    for idx, (u, v) in enumerate(zip(path[:-1], path[1:])):
-        data = min(G.get_edge_data(u, v).values(), key=lambda d: d.get("length", 0))
-        highway = _normalize_highway(data.get("highway"))
-        tunnel = _has_attr(data.get("tunnel"), {"yes", "building_passage"})
-        bridge = _has_attr(data.get("bridge"), {"yes", "viaduct"})
-        meta.append(
-            {
-                "index": idx,
-                "u": int(u),
-                "v": int(v),
-                "highway": highway,
-                "is_tunnel": tunnel,
-                "is_bridge": bridge,
-                "length": float(data.get("length", 0.0)),
-            }
+    return [
+        {
+            "index": idx,
+            "u": int(u),
+            "v": int(v),
+            "highway": highway,
+            "is_tunnel": tunnel,
+            "is_bridge": bridge,
+            "length": length,
+        }
+        for idx, (u, v, highway, tunnel, bridge, length) in enumerate(
+            zip(path, path[1:], highways, tunnels, bridges, lengths)
         )
-    return meta
+    ]
 
 
 def _normalize_highway(value: Any) -> str:
     """Highway tags can be strings, lists or missing."""
-    if isinstance(value, list):
-        return str(value[0])
-    if isinstance(value, tuple):
-        return str(value[0])
+    # Plain strings are by far the most common case; check the exact type first
+    if type(value) is str:
+        return value
     if value is None:
         return ""
+    if isinstance(value, (list, tuple)):
+        return str(value[0])
     return str(value)
 
 
-def _has_attr(value: Any, allowed: set[str]) -> bool:
+def _has_attr(value: Any, allowed: frozenset[str]) -> bool:
+    if type(value) is str:
+        return value in allowed
     if value is None:
         return False
     if isinstance(value, (list, tuple, set)):
@@ -202,31 +361,13 @@ def _has_attr(value: Any, allowed: set[str]) -> bool:
     return str(value) in allowed
 
 
-def _extract_edge_attrs(data: Any) -> Dict:
-    """Normalize edge data for both simple and multi graphs.
-
-    NetworkX passes a single attribute dict for DiGraph edges but a mapping of
-    edge keys -> attribute dicts for Multi(Di)Graphs. We always want the
-    attribute dict, selecting the lowest-length edge if multiple exist.
-    """
-
-    if not isinstance(data, dict):
-        return {}
-
-    if data and all(isinstance(v, dict) for v in data.values()):
-        # MultiDiGraph: choose the edge with the smallest length (fallback 0).
-        return min(data.values(), key=lambda d: d.get("length", 0))
-
-    return data
-
-
-def _estimate_turns(G: nx.MultiDiGraph, path: List[int]) -> int:
+def _estimate_turns(degrees: Dict[int, int], path: List[int]) -> int:
     """Estimate the number of turns in a path by analyzing node connectivity."""
     turns = 0
     for i in range(1, len(path) - 1):
         node = path[i]
         # A turn occurs at intersections with multiple possible directions
-        if G.degree[node] > 2:
+        if degrees[node] > 2:
             turns += 1
     return turns
 
@@ -234,12 +375,14 @@ def _estimate_turns(G: nx.MultiDiGraph, path: List[int]) -> int:
 def _route_from_path(
     G: nx.MultiDiGraph, path: List[int], route_id: str, label: str, kind: str
 ) -> Dict:
-    length_m = _path_length(G, path)
-    coords = _path_to_coords(G, path)
-    turns = _estimate_turns(G, path)
+    edges, lengths, highways, tunnel_flags, bridge_flags = _walk_path(G, path)
+    length_m = _path_length(lengths)
+    coords = _path_to_coords(G, path, edges)
+    degrees = _route_index(G)["degree"]
+    turns = _estimate_turns(degrees, path)
 
     # Check for tunnels on the route
-    tunnels = _check_tunnels_on_route(G, path)
+    tunnels = _check_tunnels_on_route(G, path, edges, tunnel_flags)
 
     # A simple baseline risk score will be refined later in the analysis module.
     risk_score = 0.0
@@ -256,169 +399,261 @@ def _route_from_path(
 
     description = ". ".join(description_parts) if description_parts else ""
 
-    route = Route(
-        id=route_id,
-        label=label,
-        kind=kind,  # type: ignore[arg-type]
-        path=coords,
-        length_m=length_m,
-        estimated_time_min=None,
-        turn_count=turns,
-        risk_score=risk_score,
-        description=description,
-    )
-    # Extend with routing metadata that the analysis module can use later.
-    payload = asdict(route)
+    # Route fields, extended with routing metadata that the analysis module can use later.
+    payload = {
+        "id": route_id,
+        "label": label,
+        "kind": kind,
+        "path": coords,
+        "length_m": length_m,
+        "estimated_time_min": None,
+        "turn_count": turns,
+        "risk_score": risk_score,
+        "description": description,
+    }
     payload["nodes"] = [int(n) for n in path]
-    payload["nodes_meta"] = _nodes_metadata(G, path)
-    payload["edges_meta"] = _edges_metadata(G, path)
+    payload["nodes_meta"] = _nodes_metadata(degrees, path)
+    payload["edges_meta"] = _edges_metadata(path, lengths, highways, tunnel_flags, bridge_flags)
     return payload
 
 
-def _shortest_route(G: nx.MultiDiGraph, start: int, via: int, end: int) -> List[int]:
-    """Compute the globally shortest route via the conference location."""
-    # Use A* with straight-line distance heuristic for better performance
-    def heuristic(u, v):
-        # Simple Euclidean distance as heuristic
-        u_coords = (G.nodes[u]['y'], G.nodes[u]['x'])
-        v_coords = (G.nodes[v]['y'], G.nodes[v]['x'])
-        return ox.distance.great_circle(u_coords[0], u_coords[1], v_coords[0], v_coords[1])
+def _route_index(G: nx.MultiDiGraph) -> Dict[str, Any]:
+    """Flat CSR view of the graph with per-edge routing weights, cached on ``G.graph``.
 
-    try:
-        path1 = nx.astar_path(G, start, via, heuristic=heuristic, weight="length")
-        path2 = nx.astar_path(G, via, end, heuristic=heuristic, weight="length")
-    except nx.NetworkXNoPath:
-        # Fallback to Dijkstra if A* fails
-        path1 = nx.shortest_path(G, start, via, weight="length")
-        path2 = nx.shortest_path(G, via, end, weight="length")
+    Parallel edges collapse to one ``(u, v)`` entry carrying the same weight the
+    NetworkX weight functions would pick, so every strategy can run as a plain
+    array-weighted Dijkstra. The attributes of each pair's shortest parallel
+    edge are kept by position (``edge_attrs``, ``edge_length``, ``highway``,
+    ``tunnel``, ``bridge``) for building route payloads, and node degrees are
+    snapshotted in ``degree``.
+    """
+    index = G.graph.get("_route_index")
+    # Graphs unpickled from an older layout rebuild their index
+    if index is None or index.get("version") != ROUTE_INDEX_VERSION:
+        node_ids = list(G.nodes)
+        position = {n: i for i, n in enumerate(node_ids)}
+        degree = dict(G.degree())
+        indptr = [0]
+        indices: List[int] = []
+        pairs: Dict[Tuple[int, int], int] = {}
+        edge_attrs: List[Dict] = []
+        lengths: List[float] = []
+        edge_lengths: List[float] = []
+        highways: List[str] = []
+        base_lengths: List[float] = []
+        logical_factors: List[float] = []
+        safest_factors: List[float] = []
+        tunnels: List[bool] = []
+        bridges: List[bool] = []
+        complex_junctions: List[bool] = []
+        # Private NetworkX storage (succ dict-of-dicts), read directly to skip
+        # the public views' per-edge dispatch while building the index.
+        for u, nbrs in G._adj.items():
+            for v, parallel in nbrs.items():
+                pairs[(u, v)] = len(indices)
+                indices.append(position[v])
+                # Same pick as networkx's weight="length" on a multigraph
+                lengths.append(min(d.get("length", 1) for d in parallel.values()))
+                if len(parallel) == 1:
+                    attrs = next(iter(parallel.values()))
+                else:
+                    # Shortest parallel edge, first one on ties (missing length counts as 0)
+                    attrs = min(parallel.values(), key=lambda d: d.get("length", 0))
+                edge_attrs.append(attrs)
+                edge_lengths.append(float(attrs.get("length", 0.0)))
+                base_lengths.append(float(attrs.get("length", 1.0)))
+                highway = _normalize_highway(attrs.get("highway"))
+                highways.append(highway)
+                logical_factors.append(LOGICAL_HIGHWAY_FACTORS.get(highway, 1.0))
+                safest_factors.append(SAFEST_HIGHWAY_FACTORS.get(highway, 1.0))
+                tunnels.append(_has_attr(attrs.get("tunnel"), TUNNEL_VALUES))
+                bridges.append(_has_attr(attrs.get("bridge"), BRIDGE_VALUES))
+                complex_junctions.append(degree[u] > 3 or degree[v] > 3)
+            indptr.append(len(indices))
+        base = np.array(base_lengths, dtype=float)
+        index = {
+            "version": ROUTE_INDEX_VERSION,
+            "node_ids": node_ids,
+            "position": position,
+            "indptr": np.array(indptr, dtype=np.int32),
+            "indices": np.array(indices, dtype=np.int32),
+            "pairs": pairs,
+            "edge_attrs": edge_attrs,
+            "edge_length": np.array(edge_lengths, dtype=float),
+            "highway": highways,
+            "tunnel": np.array(tunnels, dtype=bool),
+            "bridge": np.array(bridges, dtype=bool),
+            "degree": degree,
+            "length": np.array(lengths, dtype=float),
+            "logical": _logical_weights(base, np.array(logical_factors, dtype=float)),
+            "safest": _safest_weights(
+                base,
+                np.array(tunnels, dtype=bool),
+                np.array(bridges, dtype=bool),
+                np.array(safest_factors, dtype=float),
+                np.array(complex_junctions, dtype=bool),
+            ),
+        }
+        G.graph["_route_index"] = index
+    return index
 
-    return path1 + path2[1:]
 
+def _edge_weights(
+    G: nx.MultiDiGraph, kind: str, avoid_edges: set[Tuple[int, int]] = frozenset(), penalty: float = 1.0
+) -> np.ndarray:
+    """Per-edge weights for one routing strategy with reused edges penalised."""
+    index = _route_index(G)
+    weights = index[kind]
+    if avoid_edges:
+        weights = weights.copy()
+        pairs = index["pairs"]
+        weights[[pairs[e] for e in avoid_edges if e in pairs]] *= penalty
+    return weights
 
-def _calculate_turn_angle(G: nx.MultiDiGraph, prev_u: int, u: int, v: int) -> float:
-    """Calculate the turning angle at node u when going from prev_u to v."""
-    if prev_u == u or u == v:
-        return 0.0
 
-    # Get coordinates
-    prev_coords = (G.nodes[prev_u]['x'], G.nodes[prev_u]['y'])
-    u_coords = (G.nodes[u]['x'], G.nodes[u]['y'])
-    v_coords = (G.nodes[v]['x'], G.nodes[v]['y'])
+def _shortest_path_trees(
+    G: nx.MultiDiGraph, sources: List[int], weights: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Distances and predecessors (by index position) from each source to every node.
 
-    # Calculate vectors
-    vec1 = (u_coords[0] - prev_coords[0], u_coords[1] - prev_coords[1])
-    vec2 = (v_coords[0] - u_coords[0], v_coords[1] - u_coords[1])
+    Returns one row per source; scipy handles all sources in a single call.
+    """
+    index = _route_index(G)
+    position = index["position"]
+    n = len(position)
+    if dijkstra is not None:
+        graph = csr_matrix((weights, index["indices"], index["indptr"]), shape=(n, n))
+        return dijkstra(graph, indices=[position[s] for s in sources], return_predecessors=True)
+
+    weight = _weight_lookup(G, weights)
+    dist = np.full((len(sources), n), np.inf)
+    pred = np.full((len(sources), n), -9999, dtype=np.int32)
+    for row, source in enumerate(sources):
+        dist_by_node, paths = nx.single_source_dijkstra(G, source, weight=weight)
+        for node, path in paths.items():
+            dist[row, position[node]] = dist_by_node[node]
+            if len(path) > 1:
+                pred[row, position[node]] = position[path[-2]]
+    return dist, pred
+
+
+def _weight_lookup(G: nx.MultiDiGraph, weights: np.ndarray):
+    """NetworkX weight callable reading the precomputed per-edge weights."""
+    pairs = _route_index(G)["pairs"]
+    return lambda u, v, d: weights[pairs[(u, v)]]
+
+
+def _shortest_path_tree(G: nx.MultiDiGraph, source: int, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Distances and predecessors (by index position) from ``source`` to every node."""
+    dist, pred = _shortest_path_trees(G, [source], weights)
+    return dist[0], pred[0]
+
+
+def _tree_path(G: nx.MultiDiGraph, pred: np.ndarray, source: int, target: int) -> List[int]:
+    """Walk a predecessor array back from ``target``; raises NetworkXNoPath if unreachable."""
+    index = _route_index(G)
+    node_ids = index["node_ids"]
+    src = index["position"][source]
+    pos = index["position"][target]
+    steps = [pos]
+    while pos != src:
+        pos = pred[pos]
+        if pos < 0:
+            raise nx.NetworkXNoPath(f"No path between {source} and {target}.")
+        steps.append(pos)
+    return [node_ids[p] for p in reversed(steps)]
+
+
+def _weighted_path(G: nx.MultiDiGraph, source: int, target: int, weights: np.ndarray) -> List[int]:
+    if dijkstra is None:
+        # Point-to-point search only needs to meet in the middle, not span the graph
+        return nx.bidirectional_dijkstra(G, source, target, weight=_weight_lookup(G, weights))[1]
+    _, pred = _shortest_path_tree(G, source, weights)
+    return _tree_path(G, pred, source, target)
+
+
+def _via_path(G: nx.MultiDiGraph, start: int, via: int, end: int, weights: np.ndarray) -> List[int]:
+    if dijkstra is None:
+        path1 = _weighted_path(G, start, via, weights)
+        path2 = _weighted_path(G, via, end, weights)
+        return path1 + path2[1:]
+    # Both legs share the weights, so their trees come out of one Dijkstra call
+    _, preds = _shortest_path_trees(G, [start, via], weights)
+    path1 = _tree_path(G, preds[0], start, via)
+    path2 = _tree_path(G, preds[1], via, end)
+    return path1 + path2[1:]
 
-    # Calculate angle using dot product
-    dot_product = vec1[0] * vec2[0] + vec1[1] * vec2[1]
-    mag1 = (vec1[0]**2 + vec1[1]**2)**0.5
-    mag2 = (vec2[0]**2 + vec2[1]**2)**0.5
 
-    if mag1 == 0 or mag2 == 0:
-        return 0.0
+def _shortest_route(G: nx.MultiDiGraph, start: int, via: int, end: int) -> List[int]:
+    """Compute the globally shortest route via the conference location."""
+    return _via_path(G, start, via, end, _edge_weights(G, "length"))
 
-    cos_angle = dot_product / (mag1 * mag2)
-    cos_angle = max(-1, min(1, cos_angle))  # Clamp to avoid floating point errors
 
-    angle = abs(math.acos(cos_angle))
-    return angle
+def _logical_weights(lengths: np.ndarray, highway_factors: np.ndarray) -> np.ndarray:
+    """Favor higher-category roads: length scaled by road class (see LOGICAL_HIGHWAY_FACTORS)."""
+    return lengths * highway_factors
 
 
 def _logical_route(
     G: nx.MultiDiGraph, start: int, via: int, end: int, avoid_edges: set[Tuple[int, int]]
 ) -> List[int]:
     """Favor higher-category roads and fewer turns using a custom weight."""
-
-    def edge_weight(u: int, v: int, data: Dict) -> float:
-        attrs = _extract_edge_attrs(data)
-        base = float(attrs.get("length", 1.0))
-        highway = _normalize_highway(attrs.get("highway"))
-
-        # Strong preference for highways and major roads
-        if highway in {"motorway", "trunk"}:
-            base *= 0.6  # Strong preference for highways
-        elif highway == "primary":
-            base *= 0.75  # Good preference for primary roads
-        elif highway == "secondary":
-            base *= 0.85  # Moderate preference for secondary roads
-        elif highway == "tertiary":
-            base *= 0.95  # Slight preference for tertiary roads
-        elif highway in {"residential", "living_street"}:
-            base *= 1.3  # Penalty for residential streets
-        elif highway == "service":
-            base *= 1.5  # Strong penalty for service roads
-
-        if (u, v) in avoid_edges:
-            base *= 4.0  # Reduced penalty to allow some overlap but discourage it
-        return base
-
-    # Use A* for better pathfinding with turn penalties
-    def astar_edge_weight(u, v, data):
-        base_weight = edge_weight(u, v, data)
-        # Add turn penalty if we can determine it (this is simplified)
-        # In a full implementation, you'd track the previous edge
-        return base_weight
-
-    try:
-        path1 = nx.astar_path(G, start, via, weight=astar_edge_weight)
-        path2 = nx.astar_path(G, via, end, weight=astar_edge_weight)
-    except nx.NetworkXNoPath:
-        # Fallback to regular shortest path
-        path1 = nx.shortest_path(G, start, via, weight=edge_weight)
-        path2 = nx.shortest_path(G, via, end, weight=edge_weight)
-
-    return path1 + path2[1:]
+    # Reduced penalty on reused edges to allow some overlap but discourage it
+    weights = _edge_weights(G, "logical", avoid_edges, 4.0)
+    return _via_path(G, start, via, end, weights)
+
+
+def _safest_weights(
+    lengths: np.ndarray,
+    tunnels: np.ndarray,
+    bridges: np.ndarray,
+    highway_factors: np.ndarray,
+    complex_junctions: np.ndarray,
+) -> np.ndarray:
+    """Penalise tunnels, bridges, minor roads and complex intersections.
+
+    Factors are applied in a fixed order (tunnel, bridge, road class, junction),
+    unaffected edges multiplying by exactly 1.0.
+    """
+    weights = lengths * np.where(tunnels, 5.0, 1.0)  # Strong avoidance of tunnels
+    weights *= np.where(bridges, 2.5, 1.0)  # Moderate avoidance of bridges (they can be choke points)
+    weights *= highway_factors  # Road type preferences for safety (see SAFEST_HIGHWAY_FACTORS)
+    weights *= np.where(complex_junctions, 1.3, 1.0)  # Penalty for complex intersections
+    return weights
 
 
 def _safest_route(
     G: nx.MultiDiGraph, start: int, via: int, end: int, avoid_edges: set[Tuple[int, int]]
 ) -> List[int]:
     """Avoid tunnels and narrow residential streets where possible."""
+    # Allow some reuse of earlier routes' edges but discourage it
+    weights = _edge_weights(G, "safest", avoid_edges, 3.0)
+    return _via_path(G, start, via, end, weights)
 
-    def edge_weight(u: int, v: int, data: Dict) -> float:
-        attrs = _extract_edge_attrs(data)
-        base = float(attrs.get("length", 1.0))
-        highway = _normalize_highway(attrs.get("highway"))
-        tunnel = _has_attr(attrs.get("tunnel"), {"yes", "building_passage"})
-        bridge = _has_attr(attrs.get("bridge"), {"yes", "viaduct"})
 
-        # Heavy penalties for dangerous infrastructure
-        if tunnel:
-            base *= 5.0  # Strong avoidance of tunnels
-        if bridge:
-            base *= 2.5  # Moderate avoidance of bridges (they can be choke points)
-
-        # Road type preferences for safety
-        if highway in {"motorway", "trunk"}:
-            base *= 0.8  # Slight preference for controlled highways
-        elif highway == "primary":
-            base *= 0.9  # Slight preference for primary roads
-        elif highway == "secondary":
-            base *= 1.0  # Neutral for secondary roads
-        elif highway == "tertiary":
-            base *= 1.2  # Slight penalty for tertiary roads
-        elif highway in {"residential", "living_street"}:
-            base *= 2.0  # Strong penalty for residential areas
-        elif highway == "service":
-            base *= 3.0  # Heavy penalty for service roads
-
-        # Avoid complex intersections
-        if G.degree[u] > 3 or G.degree[v] > 3:
-            base *= 1.3  # Penalty for complex intersections
-
-        if (u, v) in avoid_edges:
-            base *= 3.0  # Allow some reuse but discourage it
-        return base
+def _segment_edges(G: nx.MultiDiGraph) -> Dict[str, List[Tuple[int, int, int]]]:
+    """Edges whose name or ref matches each manual-route segment, cached on ``G.graph``.
 
-    try:
-        path1 = nx.astar_path(G, start, via, weight=edge_weight)
-        path2 = nx.astar_path(G, via, end, weight=edge_weight)
-    except nx.NetworkXNoPath:
-        # Fallback to regular shortest path
-        path1 = nx.shortest_path(G, start, via, weight=edge_weight)
-        path2 = nx.shortest_path(G, via, end, weight=edge_weight)
-
-    return path1 + path2[1:]
+    Matching is a case-insensitive substring test against the segment's
+    alternative names, done in one pass over the edges with compiled patterns.
+    """
+    segment_edges = G.graph.get("_segment_edges")
+    if segment_edges is None:
+        segment_edges = {segment: [] for segment in MANUAL_ROUTE_SEGMENTS}
+        for u, v, k, data in G.edges(keys=True, data=True):
+            fields = [
+                value.lower()
+                for value in (_normalize_highway(data.get("name", "")), _normalize_highway(data.get("ref", "")))
+                if value
+            ]
+            # Most edges match no segment; rule them out with the combined pattern first
+            if not any(_ANY_SEGMENT_PATTERN.search(field) for field in fields):
+                continue
+            for segment, pattern in _SEGMENT_PATTERNS.items():
+                if any(pattern.search(field) for field in fields):
+                    segment_edges[segment].append((u, v, k))
+        G.graph["_segment_edges"] = segment_edges
+    return segment_edges
 
 
 def _safe_route_manual(G: nx.MultiDiGraph, start: int, via: int, end: int) -> List[int]:
@@ -427,50 +662,18 @@ def _safe_route_manual(G: nx.MultiDiGraph, start: int, via: int, end: int) -> Li
     Route segments: A16-N209-A12-Konningskade-Hubertus Viaduct-S100-Korte Voorhout
     This function tries to find edges matching these road names and connect them.
     """
-    # Road segments to match (in order)
-    road_segments = [
-        "A16", "N209", "A12", "Koninginnegracht", "Hubertus Viaduct",
-        "S100", "Korte Voorhout"
-    ]
-
-    # Alternative names that might appear in OSM
-    road_alternatives = {
-        "A16": ["A16", "A 16", "rijksweg 16"],
-        "N209": ["N209", "N 209", "rijksweg 209"],
-        "A12": ["A12", "A 12", "rijksweg 12"],
-        "Koninginnegracht": ["Koninginnegracht", "Koninginne gracht", "Koningskade"],
-        "Hubertus Viaduct": ["Hubertus Viaduct", "Hubertusviaduct", "Hubertus"],
-        "S100": ["S100", "S 100", "provincialeweg 100"],
-        "Korte Voorhout": ["Korte Voorhout", "Kortevoorhout"]
-    }
-
-    def matches_road_name(edge_data: Dict, target_roads: List[str]) -> bool:
-        """Check if edge name matches any of the target road names."""
-        highway_name = _normalize_highway(edge_data.get("name", ""))
-        highway_ref = _normalize_highway(edge_data.get("ref", ""))
-
-        for target in target_roads:
-            # Check exact matches and case-insensitive matches
-            if (highway_name and target.lower() in highway_name.lower()) or \
-               (highway_ref and target.lower() in highway_ref.lower()):
-                return True
-        return False
-
-    # Find all edges that match our road segments
-    segment_edges = {segment: [] for segment in road_segments}
-
-    for u, v, k, data in G.edges(keys=True, data=True):
-        for segment, alternatives in road_alternatives.items():
-            if matches_road_name(data, alternatives):
-                segment_edges[segment].append((u, v, k))
+    road_segments = MANUAL_ROUTE_SEGMENTS
+    segment_edges = _segment_edges(G)
 
     # Try to build a path by connecting segments
     path = []
     current_node = start
+    lengths = _edge_weights(G, "length")
+    position = _route_index(G)["position"]
 
     # First, get from start to the first road segment
     try:
-        path_to_first = nx.shortest_path(G, current_node, via, weight="length")
+        path_to_first = _weighted_path(G, current_node, via, lengths)
         path.extend(path_to_first[:-1])  # Don't duplicate the via node
     except nx.NetworkXNoPath:
         # If direct path fails, use a basic approach
@@ -483,26 +686,21 @@ def _safe_route_manual(G: nx.MultiDiGraph, start: int, via: int, end: int) -> Li
             logger.warning(f"No edges found for road segment: {segment}")
             continue
 
-        # Find the closest edge to current position
-        min_distance = float('inf')
+        # Find the closest edge to current position: one shortest-path tree from
+        # the current node covers every candidate edge start (inf when unreachable)
         best_edge = None
-
-        for u, v, k in edges:
-            try:
-                # Distance from current node to edge start
-                dist_u = nx.shortest_path_length(G, current_node, u, weight="length")
-                if dist_u < min_distance:
-                    min_distance = dist_u
-                    best_edge = (u, v, k)
-            except nx.NetworkXNoPath:
-                continue
+        distances, pred = _shortest_path_tree(G, current_node, lengths)
+        candidate_distances = distances[[position[u] for u, _, _ in edges]]
+        closest = int(candidate_distances.argmin())  # first candidate on ties
+        if np.isfinite(candidate_distances[closest]):
+            best_edge = edges[closest]
 
         if best_edge:
             u, v, k = best_edge
             # Add path to reach this edge
             if current_node != u:
                 try:
-                    sub_path = nx.shortest_path(G, current_node, u, weight="length")
+                    sub_path = _tree_path(G, pred, current_node, u)
                     path.extend(sub_path[1:])  # Skip current node to avoid duplication
                 except nx.NetworkXNoPath:
                     # Skip this edge if unreachable
@@ -516,7 +714,7 @@ def _safe_route_manual(G: nx.MultiDiGraph, start: int, via: int, end: int) -> Li
 
     # Finally, get from last segment to end
     try:
-        path_to_end = nx.shortest_path(G, current_node, end, weight="length")
+        path_to_end = _weighted_path(G, current_node, end, lengths)
         if path and path[-1] == path_to_end[0]:
             path.extend(path_to_end[1:])
         else:
@@ -544,15 +742,17 @@ def _safe_route_manual(G: nx.MultiDiGraph, start: int, via: int, end: int) -> Li
     return cleaned_path
 
 
-def _check_tunnels_on_route(G: nx.MultiDiGraph, path: List[int]) -> List[Dict]:
+def _check_tunnels_on_route(
+    G: nx.MultiDiGraph, path: List[int], edges: List[Dict], tunnel_flags: List[bool]
+) -> List[Dict]:
     """Check for tunnels and underpasses on a route and return details."""
     tunnels = []
+    nodes = G._node  # private NetworkX node-attribute dict, see _route_index
 
-    for idx, (u, v) in enumerate(zip(path[:-1], path[1:])):
-        edge_data = min(G.get_edge_data(u, v).values(), key=lambda d: d.get("length", 0))
-        tunnel = _has_attr(edge_data.get("tunnel"), {"yes", "building_passage"})
-
+    for idx, tunnel in enumerate(tunnel_flags):
         if tunnel:
+            u, v = path[idx], path[idx + 1]
+            edge_data = edges[idx]
             highway_name = _normalize_highway(edge_data.get("name", ""))
             highway_ref = _normalize_highway(edge_data.get("ref", ""))
             road_name = highway_name or highway_ref or "Unnamed road"
@@ -561,7 +761,7 @@ def _check_tunnels_on_route(G: nx.MultiDiGraph, path: List[int]) -> List[Dict]:
                 "index": idx,
                 "road_name": road_name,
                 "length_m": float(edge_data.get("length", 0)),
-                "coordinates": [(G.nodes[u]["y"], G.nodes[u]["x"]), (G.nodes[v]["y"], G.nodes[v]["x"])]
+                "coordinates": [(nodes[u]["y"], nodes[u]["x"]), (nodes[v]["y"], nodes[v]["x"])]
             })
 
     return tunnels
@@ -575,61 +775,14 @@ def compute_routes(start: LatLon, via: LatLon, end: LatLon, scenario_name: str =
     """Compute distinct routes (shortest, logical, safest, and manual safe for Rotterdam/The Hague) between waypoints.
 
     Returns a JSON-serialisable dictionary for easy use in the API layer.
+    Repeated queries are answered from an in-process cache; callers get their
+    own copy so they can annotate the routes freely.
     """
     try:
-        logger.info("Computing routes between %s -> %s -> %s", start, via, end)
-        # Use the via point as rough center for the graph.
-        G = build_graph(via, scenario_name=scenario_name)
-        start_n = _node_for_point(G, start)
-        via_n = _node_for_point(G, via)
-        end_n = _node_for_point(G, end)
-        logger.info(
-            "Graph nodes resolved: start=%s via=%s end=%s (nodes=%d edges=%d)",
-            start_n,
-            via_n,
-            end_n,
-            len(G.nodes),
-            len(G.edges),
+        routes = _compute_routes_cached(
+            tuple(map(float, start)), tuple(map(float, via)), tuple(map(float, end)), scenario_name
         )
-
-        logger.info("Computing shortest route")
-        shortest_path = _shortest_route(G, start_n, via_n, end_n)
-        shortest_edges = _edge_set(shortest_path)
-
-        logger.info("Computing logical route")
-        logical_path = _logical_route(
-            G, start_n, via_n, end_n, avoid_edges=shortest_edges
-        )
-        logical_edges = _edge_set(logical_path)
-
-        logger.info("Computing safest route")
-        # Penalise edges already used by previous routes to encourage diversity.
-        avoid_for_safest = shortest_edges | logical_edges
-        safest_path = _safest_route(
-            G, start_n, via_n, end_n, avoid_edges=avoid_for_safest
-        )
-
-        routes = {
-            "r_shortest": _route_from_path(
-                G, shortest_path, "r_shortest", "Shortest route", "shortest"
-            ),
-            "r_logical": _route_from_path(
-                G, logical_path, "r_logical", "Most logical route", "logical"
-            ),
-            "r_safest": _route_from_path(
-                G, safest_path, "r_safest", "Safest route", "safest"
-            ),
-        }
-
-        # Add manual safe route for Rotterdam/The Hague scenario
-        if scenario_name == "rotterdam_the_hague":
-            logger.info("Computing manual safe route")
-            safe_manual_path = _safe_route_manual(G, start_n, via_n, end_n)
-            routes["r_safe_manual"] = _route_from_path(
-                G, safe_manual_path, "r_safe_manual", "Safe route (manual)", "safe_manual"
-            )
-        logger.info("Route computation finished successfully")
-        return routes
+        return copy.deepcopy(routes)
     except Exception as exc:
         # In constrained environments (no network, Overpass downtime, etc.),
         # return a lightweight built-in fallback so the UI remains usable.
@@ -637,7 +790,63 @@ def compute_routes(start: LatLon, via: LatLon, end: LatLon, scenario_name: str =
         return _sample_routes()
 
 
-def _sample_routes() -> Dict[str, Dict]:
+@lru_cache(maxsize=256)
+def _compute_routes_cached(start: LatLon, via: LatLon, end: LatLon, scenario_name: str) -> Dict[str, Dict]:
+    """Route computation behind ``compute_routes``; failures propagate so fallbacks are never cached."""
+    logger.info("Computing routes between %s -> %s -> %s", start, via, end)
+    # Use the via point as rough center for the graph.
+    G = build_graph(via, scenario_name=scenario_name)
+    start_n, via_n, end_n = _nodes_for_points(G, [start, via, end])
+    logger.info(
+        "Graph nodes resolved: start=%s via=%s end=%s (nodes=%d edges=%d)",
+        start_n,
+        via_n,
+        end_n,
+        len(G.nodes),
+        len(G.edges),
+    )
+
+    logger.info("Computing shortest route")
+    shortest_path = _shortest_route(G, start_n, via_n, end_n)
+    shortest_edges = _edge_set(shortest_path)
+
+    logger.info("Computing logical route")
+    logical_path = _logical_route(
+        G, start_n, via_n, end_n, avoid_edges=shortest_edges
+    )
+    logical_edges = _edge_set(logical_path)
+
+    logger.info("Computing safest route")
+    # Penalise edges already used by previous routes to encourage diversity.
+    avoid_for_safest = shortest_edges | logical_edges
+    safest_path = _safest_route(
+        G, start_n, via_n, end_n, avoid_edges=avoid_for_safest
+    )
+
+    routes = {
+        "r_shortest": _route_from_path(
+            G, shortest_path, "r_shortest", "Shortest route", "shortest"
+        ),
+        "r_logical": _route_from_path(
+            G, logical_path, "r_logical", "Most logical route", "logical"
+        ),
+        "r_safest": _route_from_path(
+            G, safest_path, "r_safest", "Safest route", "safest"
+        ),
+    }
+
+    # Add manual safe route for Rotterdam/The Hague scenario
+    if scenario_name == "rotterdam_the_hague":
+        logger.info("Computing manual safe route")
+        safe_manual_path = _safe_route_manual(G, start_n, via_n, end_n)
+        routes["r_safe_manual"] = _route_from_path(
+            G, safe_manual_path, "r_safe_manual", "Safe route (manual)", "safe_manual"
+        )
+    logger.info("Route computation finished successfully")
+    return routes
+
+
+def _build_sample_routes() -> Dict[str, Dict]:
     """Fallback route geometries covering the Schiphol → Hague scenario."""
 
     def build_route(
@@ -756,11 +965,16 @@ def _sample_routes() -> Dict[str, Dict]:
             "Fallback route avoiding tunnels/underpasses by swinging north then west.",
         ),
     }
-    logger.info(
-        "Returning %d fallback routes (no live OSM data available)", len(routes)
-    )
     return routes
 
 
+# Built once at import; _sample_routes hands out copies so callers can mutate them.
+_SAMPLE_ROUTES = _build_sample_routes()
 
 
+def _sample_routes() -> Dict[str, Dict]:
+    """Return a fresh copy of the fallback routes."""
+    logger.info(
+        "Returning %d fallback routes (no live OSM data available)", len(_SAMPLE_ROUTES)
+    )
+    return copy.deepcopy(_SAMPLE_ROUTES)
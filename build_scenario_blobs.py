@@ -0,0 +1,51 @@
+"""Prebuild the per-scenario analysis blobs served by the web app.
+
+Run this after ``export_data.py`` (or ``quick_update.py``) has refreshed the
+CSV and GeoJSON exports. The web app then unpickles one file per scenario
+instead of parsing the exports on the first request, and serves scenarios
+without live road work from static (pre-compressed) JSON files.
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from app.routes import LIVE_ROADWORK_SCENARIOS, SCENARIOS, _export_prefix, write_scenario_blob, write_static_analysis
+from config import (
+    DEFAULT_SCENARIO,
+    ROTTERDAM_THE_HAGUE_SCENARIO,
+    SCHIPHOL_SCENARIO,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Build pickled analysis blobs and static JSON from the exported CSV/GeoJSON files."
+    )
+    parser.add_argument(
+        "--scenario",
+        choices=[
+            SCHIPHOL_SCENARIO.name,
+            ROTTERDAM_THE_HAGUE_SCENARIO.name,
+            DEFAULT_SCENARIO.name,
+        ],
+        help="Only build the blob for this scenario (defaults to all scenarios).",
+    )
+    args = parser.parse_args()
+
+    names = [args.scenario] if args.scenario else [SCHIPHOL_SCENARIO.name, ROTTERDAM_THE_HAGUE_SCENARIO.name]
+    for prefix in sorted({_export_prefix(name) for name in names}):
+        path = write_scenario_blob(prefix)
+        print(f"Wrote scenario blob {path}")
+
+    # Static JSON for GET /api/analyze/<scenario>.json; scenarios with live road
+    # work are always served dynamically
+    for name in names:
+        if name in LIVE_ROADWORK_SCENARIOS:
+            continue
+        for path in write_static_analysis(SCENARIOS[name]):
+            print(f"Wrote static analysis {path}")
+
+
+if __name__ == "__main__":
+    main()
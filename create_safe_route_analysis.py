@@ -39,12 +39,29 @@ def load_safe_route():
 
     raise ValueError("Safe route not found")
 
+def read_export_csv(path):
+    """Read an export CSV in the string format this script works with.
+
+    Current exports store ``lat``/``lon`` columns and JSON-encoded lists; convert
+    them back to ``"(lat, lon)"`` locations and ``"['a', 'b']"`` list strings.
+    """
+    df = pd.read_csv(path, float_precision="round_trip")
+    if "lat" not in df.columns:
+        return df
+
+    df["location"] = [str((lat, lon)) for lat, lon in zip(df["lat"].tolist(), df["lon"].tolist())]
+    for column in ("routes_affected", "factors", "affected_roads"):
+        if column in df.columns:
+            df[column] = [str(json.loads(value)) for value in df[column].tolist()]
+    df = df.drop(columns=["lat", "lon"])
+    return df[sorted(df.columns)]
+
 def filter_chokepoints_for_safe_route():
     """Filter existing chokepoints to find those near the safe route."""
     safe_route_path = load_safe_route()
 
     # Load existing chokepoints
-    cps_df = pd.read_csv(current_dir / "exports" / "chokepoints_rotterdam_the_hague.csv")
+    cps_df = read_export_csv(current_dir / "exports" / "chokepoints_rotterdam_the_hague.csv")
 
     filtered_cps = []
 
@@ -140,7 +157,7 @@ def filter_pois_for_safe_route():
     safe_route_path = load_safe_route()
 
     # Load existing POIs
-    pois_df = pd.read_csv(current_dir / "exports" / "pois_rotterdam_the_hague.csv")
+    pois_df = read_export_csv(current_dir / "exports" / "pois_rotterdam_the_hague.csv")
 
     filtered_pois = []
 
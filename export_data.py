@@ -70,8 +70,21 @@ def _to_geojson_route_features(routes: Dict[str, Dict]) -> Dict:
     return {"type": "FeatureCollection", "features": features}
 
 
+def _csv_row(row: Dict) -> Dict:
+    """Flatten a row for CSV: ``location`` becomes lat/lon columns, lists become JSON."""
+    out: Dict = {}
+    for key, value in row.items():
+        if key == "location" and value is not None:
+            out["lat"], out["lon"] = value
+        elif isinstance(value, (list, tuple)):
+            out[key] = json.dumps(list(value))
+        else:
+            out[key] = value
+    return out
+
+
 def _write_csv(path: Path, rows: Iterable[Dict]):
-    rows = list(rows)
+    rows = [_csv_row(row) for row in rows]
     if not rows:
         return
     fieldnames = sorted(rows[0].keys())
@@ -4,6 +4,7 @@
 import osmnx as ox
 from pathlib import Path
 from config import ROTTERDAM_THE_HAGUE_SCENARIO, SCHIPHOL_SCENARIO
+from graph_filters import unusable_edges
 
 def generate_bbox_graph(scenario_name, route_points, padding_lat=0.05, padding_lon=0.06):
     """Generate highly optimized graph using minimal bounding box."""
@@ -27,23 +28,12 @@ def generate_bbox_graph(scenario_name, route_points, padding_lat=0.05, padding_l
     G = ox.distance.add_edge_lengths(G)
 
     # Minimal filtering - only remove completely unusable roads
-    edges_to_remove = []
-    for u, v, k, data in G.edges(keys=True, data=True):
-        highway = data.get("highway", "")
-        if isinstance(highway, list):
-            highway = highway[0] if highway else ""
-        elif not isinstance(highway, str):
-            highway = str(highway)
+    edges_to_remove = unusable_edges(G)
 
-        if highway in {"footway", "pedestrian", "cycleway", "path", "steps", "track"}:
-            edges_to_remove.append((u, v, k))
-
-    for u, v, k in edges_to_remove:
-        if G.has_edge(u, v, k):
-            G.remove_edge(u, v, k)
+    G.remove_edges_from(edges_to_remove)
 
     # Clean up isolated nodes
-    isolated = [n for n in G.nodes() if G.degree(n) == 0]
+    isolated = [n for n, degree in G.degree() if degree == 0]
     G.remove_nodes_from(isolated)
 
     # Save to precomputed directory
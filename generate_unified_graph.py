@@ -4,6 +4,7 @@
 import osmnx as ox
 from pathlib import Path
 from config import ROTTERDAM_THE_HAGUE_SCENARIO, SCHIPHOL_SCENARIO
+from graph_filters import unusable_edges
 import math
 
 def haversine_distance(coord1, coord2):
@@ -82,25 +83,14 @@ def generate_unified_graph():
     print("🧹 Filtering unsuitable roads for motorcade routes...")
 
     # Filter out roads unsuitable for motorcades
-    edges_to_remove = []
-    for u, v, k, data in G.edges(keys=True, data=True):
-        highway = data.get("highway", "")
-        if isinstance(highway, list):
-            highway = highway[0] if highway else ""
-        elif not isinstance(highway, str):
-            highway = str(highway)
-
-        # Remove completely unusable roads
-        if highway in {"footway", "pedestrian", "cycleway", "path", "steps", "track"}:
-            edges_to_remove.append((u, v, k))
+    # Remove completely unusable roads
+    edges_to_remove = unusable_edges(G)
 
     # Remove the filtered edges
-    for u, v, k in edges_to_remove:
-        if G.has_edge(u, v, k):
-            G.remove_edge(u, v, k)
+    G.remove_edges_from(edges_to_remove)
 
     # Clean up isolated nodes
-    isolated_nodes = [node for node in G.nodes() if G.degree(node) == 0]
+    isolated_nodes = [node for node, degree in G.degree() if degree == 0]
     G.remove_nodes_from(isolated_nodes)
 
     # Save the unified graph
@@ -124,9 +114,11 @@ def verify_airport_coverage(G):
         "Rotterdam": ROTTERDAM_THE_HAGUE_SCENARIO.start
     }
 
-    for name, coords in airports.items():
-        # Find nearest node in graph
-        nearest_node = ox.nearest_nodes(G, coords[1], coords[0])  # lon, lat
+    # Find nearest nodes for all airports with one spatial index build
+    points = list(airports.values())
+    nearest_nodes = ox.nearest_nodes(G, [lon for _, lon in points], [lat for lat, _ in points])
+
+    for (name, coords), nearest_node in zip(airports.items(), nearest_nodes):
         node_coords = (G.nodes[nearest_node]['y'], G.nodes[nearest_node]['x'])  # lat, lon
 
         distance = haversine_distance(coords, node_coords)
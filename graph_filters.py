@@ -0,0 +1,20 @@
+"""Road filters shared by the graph generation scripts."""
+
+# Ways no motorcade can use
+UNUSABLE_HIGHWAYS = frozenset({"footway", "pedestrian", "cycleway", "path", "steps", "track"})
+
+
+def primary_highway(highway):
+    """Highway tags can be lists (merged ways) or non-strings; use the first entry as a string."""
+    if isinstance(highway, list):
+        return highway[0] if highway else ""
+    return highway if isinstance(highway, str) else str(highway)
+
+
+def unusable_edges(G):
+    """(u, v, key) of every edge whose road class is in UNUSABLE_HIGHWAYS."""
+    return [
+        (u, v, k)
+        for u, v, k, highway in G.edges(keys=True, data="highway", default="")
+        if primary_highway(highway) in UNUSABLE_HIGHWAYS
+    ]